@@ -0,0 +1,139 @@
+from argparse import ArgumentParser
+from collections.abc import Sequence
+from contextlib import suppress
+from dataclasses import dataclass
+import gc
+from importlib.metadata import PackageNotFoundError, version
+import json
+from pathlib import Path
+import platform
+import sys
+from time import perf_counter
+
+from benchmarks.cases import CASES, Case
+from benchmarks.documents import Document, DocumentSpec
+from bigxml.stream import READ_SIZE_DEFAULT
+
+
+@dataclass(frozen=True)
+class Result:
+    case: str
+    items: int
+    seconds: float
+    mb_per_second: float
+    elements_per_second: float
+    peak_memory: int | None  # bytes, None when tracemalloc is not available
+    peak_blocks: int | None  # memory blocks allocated at peak
+
+
+def _measure_time(
+    case: Case, document: Document, read_size: int | None, repeat: int
+) -> tuple[int, float]:
+    items = 0
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = perf_counter()
+        items = sum(1 for _ in case(document, read_size))
+        best = min(best, perf_counter() - start)
+    return items, best
+
+
+def _measure_memory(
+    case: Case, document: Document, read_size: int | None
+) -> tuple[int | None, int | None]:
+    try:
+        import tracemalloc  # noqa: PLC0415
+    except ImportError:  # e.g. PyPy
+        return None, None
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        blocks_baseline = sys.getallocatedblocks()
+        peak_blocks = 0
+        for _ in case(document, read_size):
+            peak_blocks = max(peak_blocks, sys.getallocatedblocks() - blocks_baseline)
+        return tracemalloc.get_traced_memory()[1], peak_blocks
+    finally:
+        tracemalloc.stop()
+
+
+def run(name: str, document: Document, read_size: int | None, repeat: int) -> Result:
+    case = CASES[name]
+    items, seconds = _measure_time(case, document, read_size, repeat)
+    peak_memory, peak_blocks = _measure_memory(case, document, read_size)
+    return Result(
+        case=name,
+        items=items,
+        seconds=seconds,
+        mb_per_second=len(document.data) / seconds / 1e6,
+        elements_per_second=document.spec.elements / seconds,
+        peak_memory=peak_memory,
+        peak_blocks=peak_blocks,
+    )
+
+
+def _bigxml_version() -> str | None:
+    with suppress(PackageNotFoundError):
+        return version("bigxml")
+    return None
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    defaults = DocumentSpec()
+    parser = ArgumentParser(
+        prog="python -m benchmarks",
+        description="Measure bigxml throughput and memory on synthetic documents.",
+    )
+    parser.add_argument("--width", type=int, default=defaults.width)
+    parser.add_argument("--depth", type=int, default=defaults.depth)
+    parser.add_argument("--attributes", type=int, default=defaults.attributes)
+    parser.add_argument("--text-size", type=int, default=defaults.text_size)
+    parser.add_argument(
+        "--read-size",
+        type=int,
+        default=READ_SIZE_DEFAULT,
+        help="read size of Parser, 0 for adaptive (default: %(default)s)",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--case",
+        action="append",
+        choices=sorted(CASES),
+        help="case to run, can be repeated (default: all)",
+    )
+    parser.add_argument(
+        "--output", type=Path, help="write JSON results to a file (default: stdout)"
+    )
+    args = parser.parse_args(argv)
+
+    spec = DocumentSpec(
+        width=args.width,
+        depth=args.depth,
+        attributes=args.attributes,
+        text_size=args.text_size,
+    )
+    document = Document.generate(spec)
+    read_size = args.read_size or None
+    results = [
+        run(name, document, read_size, args.repeat) for name in args.case or CASES
+    ]
+
+    report = {
+        "bigxml": _bigxml_version(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "document": {**spec.as_dict(), "bytes": len(document.data)},
+        "read_size": read_size,
+        "results": [result.__dict__ for result in results],
+    }
+    output = json.dumps(report, indent=2) + "\n"
+    if args.output is None:
+        sys.stdout.write(output)
+    else:
+        args.output.write_text(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+from collections.abc import Callable, Iterator
+
+from benchmarks.documents import Document
+from bigxml import Parser, XMLElement, XMLText, xml_handle_element, xml_handle_text
+
+# each case parses the whole document and yields one item per record
+# the read size is given to Parser
+Case = Callable[[Document, int | None], Iterator[object]]
+
+
+def _walk(node: XMLElement | XMLText) -> Iterator[int]:
+    if isinstance(node, XMLElement):
+        yield len(node.attributes)
+        yield from node.iter_from(_walk)
+
+
+@xml_handle_element("root", "level0")
+def _function_handler(node: XMLElement) -> Iterator[int]:
+    yield len(node.attributes) + sum(node.iter_from(_walk))
+
+
+@xml_handle_element("root", "level0")
+class _Record:
+    def __init__(self, node: XMLElement) -> None:
+        self.attributes = dict(node.attributes)
+        self.text = ""
+        self.children = 0
+
+    @xml_handle_text
+    def handle_text(self, node: XMLText) -> None:
+        self.text = node.text
+
+    @xml_handle_element("level1")
+    def handle_child(self, node: XMLElement) -> None:
+        self.children = sum(node.iter_from(_walk))
+
+
+@xml_handle_element("root", "level0")
+def _text_handler(node: XMLElement) -> Iterator[str]:
+    yield node.text
+
+
+def function_handler(document: Document, read_size: int | None) -> Iterator[object]:
+    return Parser(document.data, read_size=read_size).iter_from(_function_handler)
+
+
+def class_handler(document: Document, read_size: int | None) -> Iterator[object]:
+    return Parser(document.data, read_size=read_size).iter_from(_Record)
+
+
+def element_text(document: Document, read_size: int | None) -> Iterator[object]:
+    return Parser(document.data, read_size=read_size).iter_from(_text_handler)
+
+
+def stream_chain(document: Document, read_size: int | None) -> Iterator[object]:
+    return Parser(*document.chunks, read_size=read_size).iter_from(_function_handler)
+
+
+CASES: dict[str, Case] = {
+    "function_handler": function_handler,
+    "class_handler": class_handler,
+    "element_text": element_text,
+    "stream_chain": stream_chain,
+}
@@ -0,0 +1,52 @@
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass
+
+
+@dataclass(frozen=True)
+class DocumentSpec:
+    # shape of a synthetic document: the root element contains `width` records;
+    # each record is a chain of `depth` nested elements, each of them having
+    # `attributes` attributes and a text of `text_size` bytes
+    width: int = 10_000
+    depth: int = 5
+    attributes: int = 3
+    text_size: int = 32
+
+    @property
+    def elements(self) -> int:
+        return self.width * self.depth
+
+    def as_dict(self) -> dict[str, int]:
+        return {**asdict(self), "elements": self.elements}
+
+
+def _record(spec: DocumentSpec, index: int) -> bytes:
+    attributes = b"".join(
+        b' attr%d="value%d"' % (i, index) for i in range(spec.attributes)
+    )
+    text = (b"%d " % index * spec.text_size)[: spec.text_size]
+    opening = b"".join(
+        b"<level%d%s>%s" % (i, attributes, text) for i in range(spec.depth)
+    )
+    closing = b"".join(b"</level%d>" % i for i in reversed(range(spec.depth)))
+    return opening + closing
+
+
+def generate_chunks(spec: DocumentSpec) -> Iterator[bytes]:
+    # the document is given by chunks: the root tags, then one chunk per record
+    yield b'<?xml version="1.0" encoding="utf-8"?>\n<root>'
+    for index in range(spec.width):
+        yield _record(spec, index)
+    yield b"</root>\n"
+
+
+@dataclass(frozen=True)
+class Document:
+    spec: DocumentSpec
+    chunks: tuple[bytes, ...]
+    data: bytes
+
+    @classmethod
+    def generate(cls, spec: DocumentSpec) -> "Document":
+        chunks = tuple(generate_chunks(spec))
+        return cls(spec, chunks, b"".join(chunks))
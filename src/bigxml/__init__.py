@@ -1,17 +1,24 @@
+from bigxml.decode import iter_decoded, write_decoded
 from bigxml.exceptions import BigXmlError
 from bigxml.handler_marker import HandlerTypeHelper, xml_handle_element, xml_handle_text
 from bigxml.nodes import XMLElement, XMLElementAttributes, XMLText
 from bigxml.parser import Parser
+from bigxml.split import split_file
+from bigxml.stats import ParserStats
 from bigxml.typing import Streamable
 
 __all__ = (
     "BigXmlError",
     "HandlerTypeHelper",
     "Parser",
+    "ParserStats",
     "Streamable",
     "XMLElement",
     "XMLElementAttributes",
     "XMLText",
+    "iter_decoded",
+    "split_file",
+    "write_decoded",
     "xml_handle_element",
     "xml_handle_text",
 )
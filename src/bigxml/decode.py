@@ -0,0 +1,48 @@
+from base64 import b64decode
+from binascii import Error as BinasciiError
+from collections.abc import Callable, Iterable, Iterator
+from functools import partial
+
+from bigxml.typing import SupportsWrite
+
+# by encoding: size of groups of characters decoded together, and decoding function
+_DECODERS: dict[str, tuple[int, Callable[[str], bytes]]] = {
+    "base64": (4, partial(b64decode, validate=True)),
+    "hex": (2, bytes.fromhex),
+}
+
+
+def iter_decoded(chunks: Iterable[str], encoding: str = "base64") -> Iterator[bytes]:
+    # decodes a text given by chunks (e.g. from XMLText.iter_chunks) chunk by chunk,
+    # so that the whole encoded or decoded data is never kept in memory
+    # whitespace is ignored
+    try:
+        group_size, decode = _DECODERS[encoding]
+    except KeyError:
+        raise ValueError(f"Encoding must be one of: {', '.join(_DECODERS)}") from None
+
+    pending = ""  # incomplete group of characters
+    padded = False
+    for chunk in chunks:
+        data = pending + "".join(chunk.split())
+        size = len(data) - len(data) % group_size
+        pending = data[size:]
+        if size:
+            if padded:
+                raise BinasciiError("Excess data after padding")
+            yield decode(data[:size])
+            padded = data.endswith("=", 0, size)
+    if pending:
+        yield decode(pending)  # raises an exception about the missing characters
+
+
+def write_decoded(
+    chunks: Iterable[str], sink: SupportsWrite[bytes], encoding: str = "base64"
+) -> int:
+    # same as iter_decoded, but the data is written to a file-like object
+    # returns the number of bytes written
+    size = 0
+    for data in iter_decoded(chunks, encoding):
+        sink.write(data)
+        size += len(data)
+    return size
@@ -0,0 +1,74 @@
+from bz2 import BZ2Decompressor
+from collections.abc import Callable
+from lzma import FORMAT_XZ, LZMADecompressor
+import sys
+from typing import Protocol
+from zlib import MAX_WBITS, decompressobj
+
+if sys.version_info < (3, 12):  # pragma: no cover
+    from typing_extensions import Buffer
+else:  # pragma: no cover
+    from collections.abc import Buffer
+
+
+class Decompressor(Protocol):
+    # interface of the decompressors of bz2, lzma and compression.zstd
+
+    @property
+    def eof(self) -> bool: ...  # pragma: no cover
+
+    @property
+    def needs_input(self) -> bool: ...  # pragma: no cover
+
+    @property
+    def unused_data(self) -> bytes: ...  # pragma: no cover
+
+    def decompress(
+        self, data: Buffer, max_length: int
+    ) -> bytes: ...  # pragma: no cover
+
+
+class GzipDecompressor:
+    def __init__(self) -> None:
+        self._decompressor = decompressobj(16 + MAX_WBITS)  # with gzip header
+        self.needs_input = True
+
+    @property
+    def eof(self) -> bool:
+        return self._decompressor.eof
+
+    @property
+    def unused_data(self) -> bytes:
+        return self._decompressor.unused_data
+
+    def decompress(self, data: Buffer, max_length: int) -> bytes:
+        # input left when max_length is reached is kept by zlib in unconsumed_tail
+        if tail := self._decompressor.unconsumed_tail:
+            data = tail + bytes(data)
+        output = self._decompressor.decompress(data, max_length)
+        self.needs_input = (
+            not self._decompressor.unconsumed_tail and len(output) < max_length
+        )
+        return output
+
+
+# by magic bytes at the start of compressed data
+DECOMPRESSORS: dict[bytes, Callable[[], Decompressor]] = {
+    b"\x1f\x8b": GzipDecompressor,
+    b"BZh": BZ2Decompressor,
+    b"\xfd7zXZ\x00": lambda: LZMADecompressor(FORMAT_XZ),
+}
+if sys.version_info >= (3, 14):  # pragma: no cover
+    from compression.zstd import ZstdDecompressor
+
+    DECOMPRESSORS[b"\x28\xb5\x2f\xfd"] = ZstdDecompressor
+
+MAGIC_SIZE = max(len(magic) for magic in DECOMPRESSORS)
+MAGIC_FIRST_BYTES = frozenset(magic[0] for magic in DECOMPRESSORS)
+
+
+def get_decompressor(data: bytes | bytearray) -> Callable[[], Decompressor] | None:
+    for magic, decompressor in DECOMPRESSORS.items():
+        if data.startswith(magic):
+            return decompressor
+    return None
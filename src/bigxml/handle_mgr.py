@@ -20,12 +20,11 @@ if TYPE_CHECKING:
 
 
 class HandleMgr:
-    _handle: (
-        Callable[
-            [Callable[[Union["XMLElement", "XMLText"]], Iterator[Any]]], Iterator[Any]
-        ]
-        | None
-    ) = None
+    __slots__ = ("_handle",)
+
+    _handle: Callable[
+        [Callable[[Union["XMLElement", "XMLText"]], Iterator[Any]]], Iterator[Any]
+    ]
 
     # iter_from
 
@@ -95,10 +94,12 @@ class HandleMgr:
     ) -> Iterator[object]: ...
 
     def iter_from(self, *handlers: Any) -> Iterator[object]:
-        if not self._handle:
-            raise RuntimeError("No handle to use")
+        try:
+            handle = self._handle
+        except AttributeError:
+            raise RuntimeError("No handle to use") from None
         handler = create_handler(*handlers)
-        return self._handle(handler)
+        return handle(handler)
 
     # return_from
 
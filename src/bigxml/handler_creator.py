@@ -1,17 +1,25 @@
 from collections.abc import Callable, Iterable, Iterator
 from dataclasses import is_dataclass
-from inspect import getmembers, isclass
-from typing import TYPE_CHECKING, Any, Union, cast
+from functools import lru_cache, partial
+from inspect import getmembers, isclass, isdatadescriptor, isfunction, ismethod
+from typing import TYPE_CHECKING, Any, Optional, Union, cast
 import warnings
+from weakref import WeakKeyDictionary
 
 from bigxml.marks import get_marks, has_marks
 from bigxml.typing import T
-from bigxml.utils import consume, get_mandatory_params, transform_to_iterator
+from bigxml.utils import (
+    consume,
+    extract_namespace_name,
+    get_mandatory_params,
+    transform_to_iterator,
+)
 
 if TYPE_CHECKING:
     from bigxml.nodes import XMLElement, XMLText
 
 CLASS_HANDLER_METHOD_NAME = "xml_handler"
+CREATE_HANDLER_CACHE_SIZE = 256
 
 
 def _assert_one_mandatory_param(
@@ -40,11 +48,22 @@ def _handler_identity(node: T) -> Iterator[T]:
     yield node
 
 
+class _InstanceMember:
+    # handler of a compiled class tree, looked up on the instance when handling
+    __slots__ = ("name",)
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f"_InstanceMember({self.name!r})"
+
+
 class _HandlerTree:
     def __init__(self, path: tuple[str, ...] = ()) -> None:
         self.path: tuple[str, ...] = path
         self.children: dict[str, _HandlerTree] = {}
-        self.handler: Callable[..., Iterable[object]] | None = None
+        self.handler: Callable[..., Iterable[object]] | _InstanceMember | None = None
 
     def add_handler(
         self,
@@ -95,41 +114,65 @@ class _HandlerTree:
     def add_handler_callable(
         self,
         path: tuple[str, ...],
-        handler: Callable[..., Iterable[object]],
+        handler: Callable[..., Iterable[object]] | _InstanceMember,
     ) -> None:
         if self.handler:
             raise TypeError(f"{self.path}: catchall handler exists: {self.handler}")
         if path:
             if path[0] not in self.children:
                 self.children[path[0]] = _HandlerTree((*self.path, path[0]))
-            self.children[path[0]].add_handler(
-                path[1:], handler, ignore_direct_marks=True
-            )
+            self.children[path[0]].add_handler_callable(path[1:], handler)
         elif self.children:
             raise TypeError(f"{self.path}: handlers exist: {self.children}")
         else:
             self.handler = handler
 
-    @transform_to_iterator
-    def handle(self, node: Union["XMLElement", "XMLText"]) -> Iterable[object] | None:
-        if self.handler:
-            if isclass(self.handler):
-                return self._handle_from_class(self.handler, node)
-            return self.handler(node)
+    def bind(
+        self, instance: object
+    ) -> Callable[[Union["XMLElement", "XMLText"]], Iterator[object]]:
+        if instance is None:
+            return self.handle
+        return partial(self.handle, instance=instance)
 
+    def get_child(
+        self, node: Union["XMLElement", "XMLText"]
+    ) -> Optional["_HandlerTree"]:
+        return self._get_child(getattr(node, "namespace", None), node.name)
+
+    def get_child_by_tag(self, tag: str) -> Optional["_HandlerTree"]:
+        # same as get_child, but without having to create the node first
+        return self._get_child(*extract_namespace_name(tag))
+
+    def _get_child(self, namespace: str | None, name: str) -> Optional["_HandlerTree"]:
         child: _HandlerTree | None = None
-        namespace = getattr(node, "namespace", None)
         if namespace is not None:
-            child = self.children.get(f"{{{namespace}}}{node.name}")
+            child = self.children.get(f"{{{namespace}}}{name}")
         if child is None:
-            child = self.children.get(node.name)
+            child = self.children.get(name)
+        return child
+
+    @transform_to_iterator
+    def handle(
+        self, node: Union["XMLElement", "XMLText"], instance: object = None
+    ) -> Iterable[object] | None:
+        if self.handler:
+            handler = self.handler
+            if isinstance(handler, _InstanceMember):
+                handler = cast(
+                    "Callable[..., Iterable[object]]", getattr(instance, handler.name)
+                )
+            if isclass(handler):
+                return self._handle_from_class(handler, node)
+            return handler(node)
+
+        child = self.get_child(node)
         if child is not None:
             if child.handler:
-                return child.handle(node)
+                return child.handle(node, instance)
             if hasattr(node, "iter_from"):
                 # it would have been better to test for isinstance(node, XMLElement)
                 # to avoid the cast but that would have been a cyclic import
-                return cast("XMLElement", node).iter_from(child.handle)
+                return cast("XMLElement", node).iter_from(child.bind(instance))
         return None
 
     @staticmethod
@@ -148,20 +191,16 @@ class _HandlerTree:
             raise
         instance = klass(node) if init_mandatory_params else klass()
 
-        # create handler tree
-        sub_tree = _HandlerTree()
+        # bind handler tree
+        sub_handle = _ClassPlan.get(klass).bind(instance)
         items: Iterable[object] = ()  # empty iterable
-        try:
-            sub_tree.add_handler((), instance, ignore_direct_marks=True)
-        except TypeError:
-            pass  # no marks on public attributes
-        else:
+        if sub_handle is not None:
             if has_marks(klass):
                 if hasattr(node, "iter_from"):
                     # it would have been better to test for isinstance(node, XMLElement)
-                    items = cast("XMLElement", node).iter_from(sub_tree.handle)
+                    items = cast("XMLElement", node).iter_from(sub_handle)
             else:
-                items = sub_tree.handle(node)
+                items = sub_handle(node)
 
         # handle custom handler method
         wrapper = getattr(instance, CLASS_HANDLER_METHOD_NAME, None)
@@ -203,10 +242,129 @@ class _HandlerTree:
         return _assert_iterable_or_none(wrapper(), klass, CLASS_HANDLER_METHOD_NAME)
 
 
-def create_handler(
+class _ClassPlan:
+    # handler tree of a class, built once from the class members
+    # and then bound to each instance instead of inspecting it
+
+    _cache: "WeakKeyDictionary[type[Any], _ClassPlan]" = WeakKeyDictionary()
+
+    def __init__(self, klass: type[Any]) -> None:
+        self.member_names: set[str] = set()
+        self.descriptor_names: list[str] = []
+        self.tree: _HandlerTree | None = _HandlerTree()
+        try:
+            for name, member in getmembers(klass):
+                if name.startswith("__"):
+                    continue
+                if isdatadescriptor(member):
+                    # e.g. property or slot: the value depends on the instance
+                    self.descriptor_names.append(name)
+                for sub_path in get_marks(member):
+                    self.member_names.add(name)
+                    if callable(member):
+                        self.tree.add_handler_callable(sub_path, _InstanceMember(name))
+                    else:
+                        self.tree.add_handler(
+                            sub_path, member, ignore_direct_marks=True
+                        )
+        except TypeError:
+            self.tree = None  # conflicting marks on public attributes
+        if not self.member_names:
+            self.tree = None  # no marks on public attributes
+
+    @classmethod
+    def get(cls, klass: type[Any]) -> "_ClassPlan":
+        try:
+            return cls._cache[klass]
+        except KeyError:
+            plan = cls._cache[klass] = cls(klass)
+            return plan
+
+    def _is_bindable(self, instance: object) -> bool:
+        # the instance may expose handlers that cannot be seen on the class
+        if callable(instance):
+            return False
+        for name, value in getattr(instance, "__dict__", {}).items():
+            if name in self.member_names or has_marks(value):
+                return False
+        return not any(
+            has_marks(getattr(instance, name, None)) for name in self.descriptor_names
+        )
+
+    def bind(
+        self, instance: object
+    ) -> Callable[[Union["XMLElement", "XMLText"]], Iterator[object]] | None:
+        if self._is_bindable(instance):
+            return None if self.tree is None else self.tree.bind(instance)
+
+        # slow path: inspect the instance itself
+        sub_tree = _HandlerTree()
+        try:
+            sub_tree.add_handler((), instance, ignore_direct_marks=True)
+        except TypeError:
+            return None  # no marks on public attributes
+        return sub_tree.handle
+
+
+def _is_cacheable(handler: object) -> bool:
+    # the handler tree built from these can not change over time
+    # (contrary to e.g. lists or class instances)
+    # bound methods and closures are not cached: they are usually created for each
+    # node, so that caching them would keep alive what they reference without hits
+    if isinstance(handler, tuple):
+        return all(isinstance(item, str) for item in handler)
+    return (
+        (isfunction(handler) and handler.__closure__ is None)
+        or isclass(handler)
+        or isinstance(handler, str)
+    )
+
+
+def _create_handler(
     *args: object,
 ) -> Callable[[Union["XMLElement", "XMLText"]], Iterator[object]]:
     handler_tree = _HandlerTree()
     for arg in args:
         handler_tree.add_handler((), arg, ignore_direct_marks=False)
     return handler_tree.handle
+
+
+_create_handler_cached = lru_cache(maxsize=CREATE_HANDLER_CACHE_SIZE)(_create_handler)
+
+
+def create_handler(
+    *args: object,
+) -> Callable[[Union["XMLElement", "XMLText"]], Iterator[object]]:
+    if all(_is_cacheable(arg) for arg in args):
+        return _create_handler_cached(*args)
+    return _create_handler(*args)
+
+
+def _get_bound_handler_tree(handler: object) -> tuple[_HandlerTree, object] | None:
+    instance = None
+    if (
+        isinstance(handler, partial)
+        and not handler.args
+        and handler.keywords.keys() == {"instance"}
+    ):
+        instance = handler.keywords["instance"]
+        handler = handler.func
+    if ismethod(handler) and handler.__func__ is _HandlerTree.handle:
+        return cast("_HandlerTree", handler.__self__), instance
+    return None
+
+
+def get_handler_tree(handler: object) -> tuple[_HandlerTree, object]:
+    # handler tree (and instance it is bound to) behind a handler,
+    # so that the parser can dispatch nodes by walking the tree itself
+    bound_handler_tree = _get_bound_handler_tree(handler)
+    if bound_handler_tree is None:
+        # plain callable: use it as catchall
+        handler_tree = _HandlerTree()
+        handler_tree.handler = cast("Callable[..., Iterable[object]]", handler)
+        return handler_tree, None
+    handler_tree, instance = bound_handler_tree
+    if _get_bound_handler_tree(handler_tree.handler) is not None:
+        # catchall handler wrapping another handler tree
+        return get_handler_tree(handler_tree.handler)
+    return handler_tree, instance
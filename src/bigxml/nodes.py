@@ -1,30 +1,41 @@
 from collections.abc import Iterator, Mapping
-from dataclasses import dataclass
-from typing import Union
+from dataclasses import dataclass, field
+from typing import Any, Optional, Union, cast
 import warnings
 
 from bigxml.handle_mgr import HandleMgr
+from bigxml.typing import K
 from bigxml.utils import extract_namespace_name
 
 
 class XMLElementAttributes(Mapping[str, str]):
     def __init__(self, attributes: Mapping[str, str]) -> None:
-        self._items: dict[
-            str, tuple[int | None, str]
-        ] = {}  # key -> (alternatives, value)
+        # lookup by name without namespace needs some computations
+        # which are done on first access only
+        self._attributes = attributes
+        self._items_cache: dict[str, tuple[int | None, str]] | None = None
         self._len = 0
-        for key, value in attributes.items():
+
+    @property
+    def _items(self) -> dict[str, tuple[int | None, str]]:
+        if self._items_cache is not None:
+            return self._items_cache
+        items: dict[str, tuple[int | None, str]] = {}  # key -> (alternatives, value)
+        length = 0
+        for key, value in self._attributes.items():
             namespace, name = extract_namespace_name(key)
             if name.startswith("{"):
                 raise ValueError("Invalid key: '{key}'")
-            self._items[f"{{{namespace}}}{name}"] = (None, value)
-            self._len += 1
+            items[f"{{{namespace}}}{name}"] = (None, value)
+            length += 1
             if namespace:
-                alt_nb, alt_value = self._items.get(name, (0, value))
+                alt_nb, alt_value = items.get(name, (0, value))
                 if alt_nb is not None:
-                    self._items[name] = (alt_nb + 1, alt_value)
+                    items[name] = (alt_nb + 1, alt_value)
             else:
-                self._items[name] = (None, value)
+                items[name] = (None, value)
+        self._items_cache, self._len = items, length
+        return items
 
     def __getitem__(self, key: str) -> str:
         alternatives, value = self._items[key]
@@ -45,6 +56,7 @@ class XMLElementAttributes(Mapping[str, str]):
                 yield key.removeprefix(r"{}")
 
     def __len__(self) -> int:
+        _ = self._items  # computes _len on first access
         return self._len
 
     def __repr__(self) -> str:
@@ -54,6 +66,7 @@ class XMLElementAttributes(Mapping[str, str]):
         return str(dict(self))
 
 
+# the parser does not call this handler, but gets the texts from its events directly
 def _handler_get_text(node: Union["XMLElement", "XMLText"]) -> Iterator[str]:
     if isinstance(node, XMLText):
         yield node.text
@@ -63,17 +76,79 @@ def _handler_get_text(node: Union["XMLElement", "XMLText"]) -> Iterator[str]:
         raise TypeError  # should not happen
 
 
-@dataclass
+class _LazyParents:
+    # wraps the parents slot of nodes: nodes created by the parser only reference
+    # their direct parent, so that creating them does not depend on the depth in
+    # the document, and parents are computed on first access
+
+    def __init__(self, slot: Any) -> None:  # noqa: ANN401
+        self.slot = slot
+
+    def __get__(
+        self, node: Union["XMLElement", "XMLText", None], owner: type[Any] | None
+    ) -> Any:  # noqa: ANN401
+        if node is None:  # pragma: no cover # access from the class
+            return self
+        try:
+            return self.slot.__get__(node, owner)
+        except AttributeError:
+            pass  # not known yet
+
+        # go up the chain of parents until finding a node whose parents are known
+        chain: list[XMLElement] = []
+        parents: tuple[XMLElement, ...] = ()
+        parent = node._parent  # noqa: SLF001
+        while parent is not None:
+            chain.append(parent)
+            try:
+                parents = vars(XMLElement)["parents"].slot.__get__(parent, XMLElement)
+                break
+            except AttributeError:
+                parent = parent._parent  # noqa: SLF001
+        chain.reverse()
+        parents = (*parents, *chain)
+        self.slot.__set__(node, parents)
+        return parents
+
+    def __set__(
+        self, node: Union["XMLElement", "XMLText"], value: tuple["XMLElement", ...]
+    ) -> None:
+        self.slot.__set__(node, value)
+
+
+def _with_lazy_parents(cls: K) -> K:
+    cls.parents = _LazyParents(cls.__dict__["parents"])
+    return cls
+
+
+@_with_lazy_parents
+@dataclass(slots=True)
 class XMLElement(HandleMgr):
     name: str
     attributes: XMLElementAttributes
     parents: tuple["XMLElement", ...]
     namespace: str = ""
+    _parent: Optional["XMLElement"] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         if not self.namespace:
             self.namespace, self.name = extract_namespace_name(self.name)
 
+    @classmethod
+    def _from_parser(
+        cls,
+        tag: str,
+        attributes: XMLElementAttributes,
+        parent: Optional["XMLElement"],
+    ) -> "XMLElement":
+        node = cls.__new__(cls)
+        node.namespace, node.name = extract_namespace_name(tag)
+        node.attributes = attributes
+        node._parent = parent  # noqa: SLF001
+        return node
+
     def __str__(self) -> str:
         parts = []
         if self.namespace:
@@ -88,29 +163,89 @@ class XMLElement(HandleMgr):
 
     @property
     def text(self) -> str:
-        output = ""
+        parts: list[str] = []  # joined at the end to avoid quadratic concatenation
         last_ends_with_space = False
         for text in self.iter_from(_handler_get_text):
             if not text:
                 continue
             text_stripped = text.strip()
-            if (last_ends_with_space or not text.startswith(text_stripped)) and output:
-                output += " "
-            output += text_stripped
+            if (last_ends_with_space or not text.startswith(text_stripped)) and parts:
+                parts.append(" ")
+            if text_stripped:
+                parts.append(text_stripped)
             last_ends_with_space = not text.endswith(text_stripped)
-        return output
+        return "".join(parts)
 
 
-@dataclass
+@_with_lazy_parents
+@dataclass(slots=True)
 class XMLText:
     text: str
     parents: tuple[XMLElement, ...]
+    _parent: XMLElement | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     # classname attribute name to be easily switched on with XMLElement
     name = "\0text"  # \0 makes sure it is an invalid element name
 
+    @classmethod
+    def _from_parser(cls, text: str, parent: XMLElement | None) -> "XMLText":
+        node = cls.__new__(cls)
+        node.text = text
+        node._parent = parent  # noqa: SLF001
+        return node
+
     def __str__(self) -> str:
         parts = [repr(self.text)]
         if self.parents:
             parts.append(f"parents={'>'.join(node.name for node in self.parents)}")
         return f"XMLText({', '.join(parts)})"
+
+    def iter_chunks(self) -> Iterator[str]:
+        # the text is given by chunks when the parser has chunked_texts set
+        yield self.text
+
+
+_XMLTEXT_TEXT_SLOT = vars(XMLText)["text"]
+
+
+class _ChunkedXMLText(XMLText):
+    # text node created by the parser before its text is read, so that the text can
+    # be read by chunks instead of being kept in memory
+    __slots__ = ("_chunks",)
+
+    _chunks: Iterator[str] | None
+
+    @classmethod
+    def _from_parser_chunks(
+        cls, chunks: Iterator[str], parent: XMLElement | None
+    ) -> "_ChunkedXMLText":
+        node = cls.__new__(cls)
+        node._chunks = chunks  # noqa: SLF001
+        node._parent = parent  # noqa: SLF001
+        return node
+
+    @property
+    def text(self) -> str:
+        try:
+            return cast("str", _XMLTEXT_TEXT_SLOT.__get__(self, XMLText))
+        except AttributeError:
+            pass  # not read yet
+        if self._chunks is None:
+            raise RuntimeError("Text already read by chunks")
+        text = "".join(self.iter_chunks())
+        _XMLTEXT_TEXT_SLOT.__set__(self, text)
+        return text
+
+    @text.setter
+    def text(self, value: str) -> None:
+        _XMLTEXT_TEXT_SLOT.__set__(self, value)
+
+    def iter_chunks(self) -> Iterator[str]:
+        chunks = self._chunks
+        if chunks is None:  # text already read
+            yield self.text
+            return
+        self._chunks = None
+        yield from chunks
@@ -1,58 +1,308 @@
-from collections.abc import Callable, Iterator
-from typing import TYPE_CHECKING, Optional
+from asyncio import get_running_loop
+from collections.abc import AsyncGenerator, Callable, Iterable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import aclosing
+from functools import partial
+from os import cpu_count
+import sys
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Optional, cast, overload
 import warnings
+from xml.etree.ElementTree import Element, TreeBuilder, XMLPullParser, tostring
 
-from defusedxml.ElementTree import iterparse
+from defusedxml.ElementTree import DefusedXMLParser
 
 from bigxml.exceptions import rewrite_exceptions
 from bigxml.handle_mgr import HandleMgr
-from bigxml.nodes import XMLElement, XMLElementAttributes, XMLText
-from bigxml.stream import StreamChain
-from bigxml.typing import Streamable, T
-from bigxml.utils import IterWithRollback
+from bigxml.handler_creator import create_handler, get_handler_tree
+from bigxml.nodes import (
+    XMLElement,
+    XMLElementAttributes,
+    XMLText,
+    _ChunkedXMLText,
+    _handler_get_text,
+)
+from bigxml.stats import ParserStats
+from bigxml.stream import ASYNC_STREAMS_LOOP, READ_SIZE_DEFAULT, iter_chunks
+from bigxml.typing import (
+    ClassHandlerWithCustomWrapper0,
+    ClassHandlerWithCustomWrapper1,
+    Streamable,
+    T,
+)
+from bigxml.utils import IterWithRollback, aiter_in_thread, map_in_executor
+
+if sys.version_info < (3, 11):  # pragma: no cover
+    from typing_extensions import Never
+else:  # pragma: no cover
+    from typing import Never
 
 if TYPE_CHECKING:
-    from defusedxml.ElementTree import Element
+    from bigxml.handler_creator import _HandlerTree
+
+
+AITER_FROM_MAX_PENDING = 256
+PARALLEL_BATCH_SIZE_DEFAULT = 100
+
+# (action, element) for start and end events
+# and ("data", text) for chunks of texts when texts are chunked
+_Event = tuple[str, Any]
+
+
+class _ChunkedTextsTreeBuilder(TreeBuilder):
+    # texts are not set on elements but given as events instead, joined by chunk of
+    # data pushed to the parser, so that big texts are not kept in memory
+    def __init__(self) -> None:
+        super().__init__()
+        self._events: list[_Event] = []
+        self._data: list[str] = []
+
+    def _flush(self) -> None:
+        if self._data:
+            self._events.append(("data", "".join(self._data)))
+            self._data.clear()
+
+    def start(self, tag: str, attrs: dict[str, str]) -> Element:
+        self._flush()
+        elem = super().start(tag, attrs)
+        self._events.append(("start", elem))
+        return elem
+
+    def end(self, tag: str) -> Element:
+        self._flush()
+        elem = super().end(tag)
+        self._events.append(("end", elem))
+        return elem
+
+    def data(self, data: str) -> None:
+        self._data.append(data)
+
+    def read_events(self) -> Iterator[_Event]:
+        self._flush()
+        events, self._events = self._events, []
+        return iter(events)
+
+
+def _iterparse(
+    chunks: Iterable[memoryview],
+    *,
+    forbid_entities: bool,
+    chunked_texts: bool,
+    stats: ParserStats | None,
+) -> Iterator[_Event]:
+    # same as iterparse of defusedxml, but chunks are pushed directly to the parser
+    # instead of having it read a file-like object
+    parser: XMLPullParser | DefusedXMLParser
+    if chunked_texts:
+        target = _ChunkedTextsTreeBuilder()
+        parser = DefusedXMLParser(target=target, forbid_entities=forbid_entities)
+        events = target.read_events
+    else:
+        parser = XMLPullParser(
+            ("start", "end"),
+            _parser=DefusedXMLParser(
+                target=TreeBuilder(), forbid_entities=forbid_entities
+            ),
+        )
+        # only start and end events are asked for
+        events = cast("Callable[[], Iterator[_Event]]", parser.read_events)
+    if stats is not None:
+        yield from _iterparse_with_stats(parser, events, chunks, stats)
+        return
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from events()
+    parser.close()
+    yield from events()
+
+
+def _iterparse_with_stats(
+    parser: XMLPullParser | DefusedXMLParser,
+    events: Callable[[], Iterator[_Event]],
+    chunks: Iterable[memoryview],
+    stats: ParserStats,
+) -> Iterator[_Event]:
+    # same loop as in _iterparse, timed by chunk so that the cost stays low
+    iterator = iter(chunks)
+    next_callback = stats.events + stats.callback_every
+    while True:
+        start = perf_counter()
+        chunk = next(iterator, None)
+        read = perf_counter()
+        if chunk is None:
+            parser.close()
+        else:
+            parser.feed(chunk)
+            stats.bytes += len(chunk)
+        chunk_events = list(events())
+        parsed = perf_counter()
+        stats.read_seconds += read - start
+        stats.parse_seconds += parsed - read
+        if stats.callback is None:
+            yield from chunk_events
+            stats.events += len(chunk_events)
+        else:
+            for event in chunk_events:
+                yield event
+                stats.events += 1
+                if stats.events == next_callback:
+                    stats.callback(stats)
+                    next_callback += stats.callback_every
+        stats.handle_seconds += perf_counter() - parsed
+        if chunk is None:
+            return
+
+
+def _document_path(node: XMLElement) -> tuple[str, ...]:
+    # tags of the parents of the node and of the node, from the root element
+    return tuple(
+        f"{{{element.namespace}}}{element.name}" if element.namespace else element.name
+        for element in (*node.parents, node)
+    )
 
 
-def _parse(
-    iterator: IterWithRollback[tuple[str, "Element"]],
-    handler: Callable[[XMLElement | XMLText], Iterator[T]],
-    parents: tuple[XMLElement, ...],
+class _Events(IterWithRollback[_Event]):
+    # statistics are gathered only when asked for, as it has a cost
+    def __init__(self, iterable: Iterable[_Event], stats: ParserStats | None) -> None:
+        super().__init__(iterable)
+        self.stats = stats
+
+
+def _iter_texts(iterator: "_Events", parent_elem: "Element") -> Iterator[str]:
+    # texts of an element and of its descendants in document order, taken directly
+    # from the events instead of creating nodes and parsing children recursively
+    stack: list[Element] = []
+    current = parent_elem
+    last_child: Element | None = None
+    chunks: list[str] = []  # when texts are chunked
+    expected_iteration = iterator.iteration
+    for action, elem in iterator:
+        if action == "data":
+            chunks.append(elem)
+            continue
+        text: str | None
+        if chunks:
+            text = "".join(chunks)
+            chunks.clear()
+        else:
+            text = current.text if last_child is None else last_child.tail
+        if text:
+            yield text
+
+        if action == "start":
+            stack.append(current)
+            current = elem
+            last_child = None
+        else:
+            if not stack:
+                iterator.rollback()  # parent needs to see end tag
+                if last_child is None:
+                    # element with only a text: it is kept so that the element can
+                    # still be parsed, as when texts are not chunked
+                    parent_elem.text = text
+                    iterator.iteration = expected_iteration
+                return
+            current = stack.pop()
+            # only the tail of elem is needed from now on
+            del current[:]
+            last_child = elem
+
+
+def _iter_text_chunks(
+    iterator: "_Events", chunk: str, expected_iteration: int
+) -> Iterator[str]:
+    # chunks of a text when texts are chunked, the first one being already read
+    if iterator.iteration != expected_iteration:
+        raise RuntimeError("Tried to access a node out of order")
+    yield chunk
+    while iterator.iteration == expected_iteration:
+        action, chunk = next(iterator)
+        if action != "data":
+            iterator.rollback()  # end of text
+            return
+        expected_iteration = iterator.iteration
+        yield chunk
+    raise RuntimeError("Tried to access a node out of order")
+
+
+def _parse(  # noqa: PLR0915 # single loop for performance
+    iterator: "_Events",
+    parent: XMLElement | None,
     parent_elem: Optional["Element"],
     expected_iteration: int,
-) -> Iterator[T]:
+    handler: Callable[[XMLElement | XMLText], Iterator[object]],
+) -> Iterator[object]:
     if iterator.iteration != expected_iteration:
         raise RuntimeError("Tried to access a node out of order")
 
+    # elements matching intermediate nodes of the handler tree are not handled by
+    # calling iter_from recursively: instead their children are parsed in the same
+    # loop, and the state of the enclosing element is saved on a stack
+    handler_tree, instance = get_handler_tree(handler)
+    if (
+        handler_tree.handler is _handler_get_text
+        and not handler_tree.children
+        and parent_elem is not None
+    ):
+        yield from _iter_texts(iterator, parent_elem)
+        return
+
+    stack: list[
+        tuple[
+            _HandlerTree,
+            XMLElement | None,
+            Element | None,
+            Element | None,
+        ]
+    ] = []
     depth = 0
     last_child: Element | None = None
+    subtree = Element("")  # element started at depth 0, while depth > 0
 
-    def handle_text() -> Iterator[T]:
+    def handle_text() -> Iterator[object]:
         if last_child is not None:
             text = last_child.tail
         elif parent_elem is not None:
             text = parent_elem.text
         else:
             text = None
-        if text:
-            node = XMLText(text=text, parents=parents)
-            yield from handler(node)
+        if text and (handler_tree.handler or XMLText.name in handler_tree.children):
+            node = XMLText._from_parser(text, parent)  # noqa: SLF001
+            yield from handler_tree.handle(node, instance)
 
-    def create_node(elem: "Element", iteration: int) -> XMLElement | XMLText:
-        node = XMLElement(
-            name=elem.tag, attributes=XMLElementAttributes(elem.attrib), parents=parents
-        )
-        node._handle = lambda h: _parse(  # noqa: SLF001
-            iterator, h, (*parents, node), elem, iteration
+    def create_node(elem: "Element", iteration: int) -> XMLElement:
+        # copy attrib as the pure-Python implementation of clear empties it
+        node = XMLElement._from_parser(  # noqa: SLF001
+            elem.tag, XMLElementAttributes(elem.attrib.copy()), parent
         )
+        node._handle = partial(_parse, iterator, node, elem, iteration)  # noqa: SLF001
         return node
 
     for action, elem in iterator:
         if action == "start":
             if depth == 0:
                 yield from handle_text()
-                yield from handler(create_node(elem, iterator.iteration))
+                # no need to create a node that cannot be handled
+                child_tree = (
+                    handler_tree
+                    if handler_tree.handler
+                    else handler_tree.get_child_by_tag(elem.tag)
+                )
+                if child_tree is not None:
+                    node = create_node(elem, iterator.iteration)
+                    if iterator.stats is not None:
+                        iterator.stats.handled[_document_path(node)] += 1
+                    if child_tree.handler:
+                        yield from child_tree.handle(node, instance)
+                    else:
+                        # parse children of elem in this loop
+                        stack.append((handler_tree, parent, parent_elem, last_child))
+                        handler_tree = child_tree
+                        parent = node
+                        parent_elem = elem
+                        last_child = None
+                        continue
+                subtree = elem
 
             depth += 1
 
@@ -61,22 +311,225 @@ def _parse(
 
             if depth < 0:
                 yield from handle_text()
-                iterator.rollback()  # parent needs to see end tag
-                return
+                if not stack:
+                    iterator.rollback()  # parent needs to see end tag
+                    return
+                handler_tree, parent, parent_elem, last_child = stack.pop()
+                depth = 0
+
+            # detach ended elements from their parent, so that memory usage does not
+            # depend on the number of children
+            if depth == 1:
+                del subtree[:]
+            elif depth == 0 and parent_elem is not None:
+                del parent_elem[:]
 
             if last_child is not None:
                 last_child.clear()
 
             last_child = elem
 
+        elif action == "data":
+            if depth == 0 and (
+                handler_tree.handler or XMLText.name in handler_tree.children
+            ):
+                text_node = _ChunkedXMLText._from_parser_chunks(  # noqa: SLF001
+                    _iter_text_chunks(iterator, elem, iterator.iteration), parent
+                )
+                yield from handler_tree.handle(text_node, instance)
+                # skip chunks not read by the handler
+                while next(iterator)[0] == "data":
+                    pass
+                iterator.rollback()
+
         else:  # pragma: no cover
             raise RuntimeError  # should not happen
 
 
+def _parse_replayed(
+    iterator: "_Events",
+    elem: "Element",
+    parent: XMLElement | None,
+    matching: list[tuple[int, "_HandlerTree", "_HandlerTree", object]],
+) -> Iterator[tuple[int, object]]:
+    # elem is parsed entirely, then parsed again from a copy for each handler tree
+    depth = 0
+    while depth >= 0:
+        depth += 1 if next(iterator)[0] == "start" else -1
+    tail, elem.tail = elem.tail, None
+    data = tostring(elem, encoding="utf-8", xml_declaration=False)
+    elem.tail = tail
+    del elem[:]
+    for index, handler_tree, _, instance in matching:
+        replay = _iterparse(
+            (memoryview(data),), forbid_entities=True, chunked_texts=False, stats=None
+        )
+        for item in _parse(
+            _Events(replay, iterator.stats),
+            parent,
+            None,  # text before elem is already handled
+            0,
+            partial(handler_tree.handle, instance=instance),
+        ):
+            yield index, item
+
+
+def _parse_many(  # noqa: PLR0915 # single loop for performance
+    iterator: "_Events", handler_sets: list[tuple[int, "_HandlerTree", object]]
+) -> Iterator[tuple[int, object]]:
+    # same as _parse, with handler trees of several handler sets at once: elements
+    # matching only one handler tree are parsed with _parse, and elements matching
+    # several handler trees are parsed in this loop, or replayed for each of them if
+    # they are handled by at least one of them
+    stack: list[
+        tuple[
+            list[tuple[int, _HandlerTree, object]],
+            XMLElement | None,
+            Element | None,
+            Element | None,
+        ]
+    ] = []
+    parent: XMLElement | None = None
+    parent_elem: Element | None = None
+    depth = 0
+    last_child: Element | None = None
+    subtree = Element("")  # element started at depth 0, while depth > 0
+
+    def handle_text() -> Iterator[tuple[int, object]]:
+        if last_child is not None:
+            text = last_child.tail
+        elif parent_elem is not None:
+            text = parent_elem.text
+        else:
+            text = None
+        if text:
+            node = XMLText._from_parser(text, parent)  # noqa: SLF001
+            for index, handler_tree, instance in handler_sets:
+                if handler_tree.handler or XMLText.name in handler_tree.children:
+                    for item in handler_tree.handle(node, instance):
+                        yield index, item
+
+    def create_node(elem: "Element") -> XMLElement:
+        node = XMLElement._from_parser(  # noqa: SLF001
+            elem.tag, XMLElementAttributes(elem.attrib.copy()), parent
+        )
+        node._handle = partial(  # noqa: SLF001
+            _parse, iterator, node, elem, iterator.iteration
+        )
+        return node
+
+    for action, elem in iterator:
+        if action == "start":
+            if depth == 0:
+                yield from handle_text()
+                matching = [
+                    (index, handler_tree, child_tree, instance)
+                    for index, handler_tree, instance in handler_sets
+                    if (
+                        child_tree := handler_tree
+                        if handler_tree.handler
+                        else handler_tree.get_child_by_tag(elem.tag)
+                    )
+                    is not None
+                ]
+                if len(matching) == 1:
+                    index, handler_tree, child_tree, instance = matching[0]
+                    node = create_node(elem)
+                    if iterator.stats is not None:
+                        iterator.stats.handled[_document_path(node)] += 1
+                    for item in handler_tree.handle(node, instance):
+                        yield index, item
+                elif any(child_tree.handler for _, _, child_tree, _ in matching):
+                    # handled by several handler trees: replayed for each of them
+                    yield from _parse_replayed(iterator, elem, parent, matching)
+                    if parent_elem is not None:
+                        del parent_elem[:]
+                    if last_child is not None:
+                        last_child.clear()
+                    last_child = elem
+                    continue
+                elif matching:
+                    # parse children of elem in this loop
+                    node = create_node(elem)
+                    if iterator.stats is not None:
+                        # once per handler tree, as when parsed with each of them
+                        iterator.stats.handled[_document_path(node)] += len(matching)
+                    stack.append((handler_sets, parent, parent_elem, last_child))
+                    handler_sets = [
+                        (index, child_tree, instance)
+                        for index, _, child_tree, instance in matching
+                    ]
+                    parent = node
+                    parent_elem = elem
+                    last_child = None
+                    continue
+                subtree = elem
+
+            depth += 1
+
+        else:
+            depth -= 1
+
+            if depth < 0:
+                yield from handle_text()
+                if not stack:
+                    iterator.rollback()  # same as in _parse
+                    return
+                handler_sets, parent, parent_elem, last_child = stack.pop()
+                depth = 0
+
+            if depth == 1:
+                del subtree[:]
+            elif depth == 0 and parent_elem is not None:
+                del parent_elem[:]
+
+            if last_child is not None:
+                last_child.clear()
+
+            last_child = elem
+
+
+def _iter_record_batches(
+    iterator: Iterable[_Event], batch_size: int
+) -> Iterator[bytes]:
+    # records (i.e. children of the root element) are serialized by batches, each
+    # batch being wrapped in a copy of the root element
+    root: Element | None = None
+    wrapper = Element("")
+    depth = 0
+    for action, elem in iterator:
+        if action == "start":
+            if root is None:
+                root = elem
+                wrapper = Element(elem.tag, elem.attrib)
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 1:
+                # detach the record so that memory usage does not grow
+                cast("Element", root).remove(elem)
+                elem.tail = None
+                wrapper.append(elem)
+                if len(wrapper) >= batch_size:
+                    yield tostring(wrapper, encoding="utf-8", xml_declaration=False)
+                    del wrapper[:]
+    if len(wrapper):
+        yield tostring(wrapper, encoding="utf-8", xml_declaration=False)
+
+
+def _handle_record_batch(handlers: tuple[Any, ...], batch: bytes) -> list[object]:
+    # run in workers of iter_from_parallel
+    return list(Parser(batch).iter_from(*handlers))
+
+
 class Parser(HandleMgr):
     def __init__(
         self,
         *streams: Streamable,
+        read_size: int | None = READ_SIZE_DEFAULT,
+        prefetch: int = 0,
+        stats: ParserStats | None = None,
+        chunked_texts: bool = False,
         insecurely_allow_entities: bool = False,
     ) -> None:
         if insecurely_allow_entities:
@@ -86,13 +539,199 @@ class Parser(HandleMgr):
                 UserWarning,
                 stacklevel=1,
             )
-        iterator = IterWithRollback(
+        if read_size is not None and read_size <= 0:
+            raise ValueError("Read size must be strictly positive")
+        if prefetch < 0:
+            raise ValueError("Prefetch must be positive")
+        iterator = _Events(
             rewrite_exceptions(
-                iterparse(
-                    StreamChain(*streams),
-                    ("start", "end"),
+                _iterparse(
+                    iter_chunks(*streams, read_size=read_size, prefetch=prefetch),
                     forbid_entities=not insecurely_allow_entities,
+                    chunked_texts=chunked_texts,
+                    stats=stats,
                 )
+            ),
+            stats,
+        )
+        self._iterator = iterator
+        self._chunked_texts = chunked_texts
+        self._handle = partial(_parse, iterator, None, None, 0)
+
+    # iter_from_parallel
+
+    @overload
+    def iter_from_parallel(
+        self,
+        *handlers: Callable[[XMLElement | XMLText], Iterable[T] | None]
+        | ClassHandlerWithCustomWrapper0[T]
+        | ClassHandlerWithCustomWrapper1[T]
+        | type[ClassHandlerWithCustomWrapper0[T]]
+        | type[ClassHandlerWithCustomWrapper1[T]],
+        workers: int | None = None,
+        ordered: bool = True,
+        batch_size: int = PARALLEL_BATCH_SIZE_DEFAULT,
+        executor: Executor | None = None,
+    ) -> Iterator[T]: ...
+
+    @overload
+    def iter_from_parallel(
+        self,
+        *handlers: Callable[[XMLElement | XMLText], Iterable[T] | None]
+        | ClassHandlerWithCustomWrapper0[T]
+        | ClassHandlerWithCustomWrapper1[T]
+        | type[ClassHandlerWithCustomWrapper0[T]]
+        | type[ClassHandlerWithCustomWrapper1[T]]
+        | type[T],
+        workers: int | None = None,
+        ordered: bool = True,
+        batch_size: int = PARALLEL_BATCH_SIZE_DEFAULT,
+        executor: Executor | None = None,
+    ) -> Iterator[T]: ...
+
+    @overload
+    def iter_from_parallel(
+        self,
+        *handlers: Any,  # noqa: ANN401
+        workers: int | None = None,
+        ordered: bool = True,
+        batch_size: int = PARALLEL_BATCH_SIZE_DEFAULT,
+        executor: Executor | None = None,
+    ) -> Iterator[object]: ...
+
+    def iter_from_parallel(
+        self,
+        *handlers: Any,
+        workers: int | None = None,
+        ordered: bool = True,
+        batch_size: int = PARALLEL_BATCH_SIZE_DEFAULT,
+        executor: Executor | None = None,
+    ) -> Iterator[object]:
+        # the records are split in the current process, and handled in workers
+        if workers is not None and workers <= 0:
+            raise ValueError("Workers must be strictly positive")
+        if batch_size <= 0:
+            raise ValueError("Batch size must be strictly positive")
+        if self._chunked_texts:
+            # records are sent to workers with their texts
+            raise ValueError("Chunked texts cannot be used with iter_from_parallel")
+        if self._iterator.iteration != 0:
+            raise RuntimeError("Tried to access a node out of order")
+        max_pending = 2 * (workers or cpu_count() or 1)
+        own_executor = executor is None
+        if executor is None:
+            executor = ProcessPoolExecutor(workers)
+        try:
+            yield from map_in_executor(
+                executor,
+                partial(_handle_record_batch, handlers),
+                _iter_record_batches(self._iterator, batch_size),
+                max_pending=max_pending,
+                ordered=ordered,
             )
+        finally:
+            if own_executor:
+                executor.shutdown(cancel_futures=True)
+
+    # iter_from_many
+
+    def iter_from_many(self, *handlers: object) -> Iterator[tuple[int, object]]:
+        # each handler is used as with iter_from, but in a single pass over the
+        # streams: items are given along with the index of their handler
+        if self._chunked_texts:
+            # elements handled by several handlers are replayed with their texts
+            raise ValueError("Chunked texts cannot be used with iter_from_many")
+        if self._iterator.iteration != 0:
+            raise RuntimeError("Tried to access a node out of order")
+        yield from _parse_many(
+            self._iterator,
+            [
+                (index, *get_handler_tree(create_handler(handler)))
+                for index, handler in enumerate(handlers)
+            ],
         )
-        self._handle = lambda h: _parse(iterator, h, (), None, 0)
+
+    # aiter_from
+
+    @overload
+    def aiter_from(
+        self,
+    ) -> AsyncGenerator["Never", None]: ...
+
+    @overload
+    def aiter_from(
+        self,
+        *handlers: str | list[str] | tuple[str, ...],
+    ) -> AsyncGenerator[XMLElement, None]: ...
+
+    @overload
+    def aiter_from(
+        self,
+        *handlers: Callable[[XMLElement | XMLText], Iterable[T] | None]
+        | ClassHandlerWithCustomWrapper0[T]
+        | ClassHandlerWithCustomWrapper1[T]
+        | type[ClassHandlerWithCustomWrapper0[T]]
+        | type[ClassHandlerWithCustomWrapper1[T]],
+    ) -> AsyncGenerator[T, None]: ...
+
+    @overload
+    def aiter_from(
+        self,
+        *handlers: Callable[[XMLElement | XMLText], Iterable[T] | None]
+        | ClassHandlerWithCustomWrapper0[T]
+        | ClassHandlerWithCustomWrapper1[T]
+        | type[ClassHandlerWithCustomWrapper0[T]]
+        | type[ClassHandlerWithCustomWrapper1[T]]
+        | type[T],
+    ) -> AsyncGenerator[T, None]: ...
+
+    @overload
+    def aiter_from(
+        self,
+        *handlers: Callable[[XMLElement | XMLText], Iterable[T] | None]
+        | ClassHandlerWithCustomWrapper0[T]
+        | ClassHandlerWithCustomWrapper1[T]
+        | type[ClassHandlerWithCustomWrapper0[T]]
+        | type[ClassHandlerWithCustomWrapper1[T]]
+        | str
+        | list[str]
+        | tuple[str, ...],
+    ) -> AsyncGenerator[XMLElement | T, None]: ...
+
+    @overload
+    def aiter_from(
+        self,
+        *handlers: Callable[[XMLElement | XMLText], Iterable[T] | None]
+        | ClassHandlerWithCustomWrapper0[T]
+        | ClassHandlerWithCustomWrapper1[T]
+        | type[ClassHandlerWithCustomWrapper0[T]]
+        | type[ClassHandlerWithCustomWrapper1[T]]
+        | type[T]
+        | str
+        | list[str]
+        | tuple[str, ...],
+    ) -> AsyncGenerator[XMLElement | T, None]: ...
+
+    @overload
+    def aiter_from(
+        self,
+        *handlers: Any,  # noqa: ANN401
+    ) -> AsyncGenerator[object, None]: ...
+
+    async def aiter_from(self, *handlers: Any) -> AsyncGenerator[object, None]:
+        # parsing and handlers are run in a worker thread, which waits for the event
+        # loop to read asynchronous streams
+        loop = get_running_loop()
+
+        def iterate() -> Iterator[object]:
+            token = ASYNC_STREAMS_LOOP.set(loop)
+            try:
+                yield from self.iter_from(*handlers)
+            finally:
+                ASYNC_STREAMS_LOOP.reset(token)
+
+        async with aclosing(
+            aiter_in_thread(iterate(), AITER_FROM_MAX_PENDING)
+        ) as items:
+            async for item in items:
+                yield item
@@ -0,0 +1,137 @@
+from io import FileIO, RawIOBase
+from itertools import pairwise
+from os import PathLike, fstat
+from typing import BinaryIO
+import warnings
+from xml.parsers.expat import ExpatError, ParserCreate
+
+from bigxml.stream import READ_SIZE_MAX
+from bigxml.typing import Streamable
+
+
+class _ScanDoneError(Exception):
+    pass
+
+
+# part of a file, opened on first read so that it can be sent to other processes
+class FileRange(RawIOBase):
+    def __init__(
+        self, path: PathLike[str] | PathLike[bytes], start: int, end: int
+    ) -> None:
+        super().__init__()
+        self.path = path
+        self.start = start
+        self.end = end
+        self._position = start
+        self._file: FileIO | None = None
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: "memoryview | bytearray") -> int:  # type: ignore[override]
+        size = min(len(buffer), self.end - self._position)
+        if size <= 0:
+            if self._file is not None:
+                self._file.close()
+            return 0
+        if self._file is None:
+            self._file = FileIO(self.path)
+            self._file.seek(self._position)
+        size = self._file.readinto(memoryview(buffer)[:size])
+        self._position += size
+        return size
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+        super().close()
+
+
+def _scan(file: BinaryIO, size: int, parts: int) -> tuple[str, list[int]] | None:
+    # name of the root element, and offsets of the records (children of the root
+    # element) where the file can be split: the first record, then the first record
+    # after each of the evenly spaced targets
+    # the document is parsed (without creating nodes) to know the depth of elements,
+    # so that elements nested in records, comments, CDATA sections, etc. are skipped
+    parser = ParserCreate()
+    root_name = ""
+    splits: list[int] = []
+    target = 0
+    depth = 0
+
+    def start(name: str, _attributes: object) -> None:
+        nonlocal root_name, target, depth
+        depth += 1
+        if depth == 1:
+            root_name = name
+        elif depth == 2 and parser.CurrentByteIndex >= target:  # noqa: PLR2004
+            splits.append(parser.CurrentByteIndex)
+            if len(splits) == parts:
+                raise _ScanDoneError
+            target = splits[0] + (size - splits[0]) * len(splits) // parts
+
+    def end(_name: str) -> None:
+        nonlocal depth
+        depth -= 1
+
+    def forbid_entity(*_args: object) -> None:
+        raise ExpatError
+
+    parser.StartElementHandler = start
+    parser.EndElementHandler = end
+    parser.EntityDeclHandler = forbid_entity
+    try:
+        while chunk := file.read(READ_SIZE_MAX):
+            parser.Parse(chunk, False)  # noqa: FBT003
+        parser.Parse(b"", True)  # noqa: FBT003
+    except _ScanDoneError:
+        pass
+    except ExpatError:
+        return None  # errors are reported when parsing the file
+    if not splits:
+        return None
+    return root_name, splits
+
+
+def _split(
+    path: PathLike[str] | PathLike[bytes], parts: int
+) -> list[tuple[Streamable, ...]] | None:
+    with open(path, "rb") as file:  # noqa: PTH123 # bytes paths allowed
+        size = fstat(file.fileno()).st_size
+        scanned = _scan(file, size, parts)
+        if scanned is None:
+            return None
+        root_name, splits = scanned
+        if len(splits) < 2:  # noqa: PLR2004
+            return None  # e.g. a single record
+        if not root_name.isascii():
+            return None  # name could have another representation in bytes
+        file.seek(0)
+        prefix = file.read(splits[0])
+    suffix = f"</{root_name}>".encode()
+
+    ranges = [
+        (prefix, FileRange(path, start, end), suffix) for start, end in pairwise(splits)
+    ]
+    return [*ranges, (prefix, FileRange(path, splits[-1], size))]
+
+
+def split_file(
+    path: PathLike[str] | PathLike[bytes], parts: int
+) -> list[tuple[Streamable, ...]]:
+    # the file is split at boundaries between records (children of the root element)
+    # each part is given as streams where the root element only contains some records
+    if parts <= 0:
+        raise ValueError("Parts must be strictly positive")
+    if parts == 1:
+        return [(path,)]
+
+    split = _split(path, parts)
+    if split is None:
+        warnings.warn(
+            "No split point found in the file, it is given as a single part",
+            UserWarning,
+            stacklevel=2,
+        )
+        return [(path,)]
+    return split
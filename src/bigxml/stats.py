@@ -0,0 +1,31 @@
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+CALLBACK_EVERY_DEFAULT = 10_000
+
+
+@dataclass(slots=True)
+class ParserStats:
+    # called with the statistics every callback_every events
+    callback: Callable[["ParserStats"], object] | None = field(
+        default=None, repr=False, compare=False
+    )
+    callback_every: int = field(default=CALLBACK_EVERY_DEFAULT, repr=False)
+
+    # number of bytes of XML given to the parser (after decompression)
+    bytes: int = field(default=0, init=False)
+    # number of start and end events of elements (and of chunks of texts, if chunked)
+    # (updated after each chunk of data when there is no callback)
+    events: int = field(default=0, init=False)
+    # number of elements given to handlers (including intermediate nodes of paths),
+    # by path of the elements in the document
+    handled: Counter[tuple[str, ...]] = field(default_factory=Counter, init=False)
+    # time spent reading streams, parsing them, and handling the events
+    read_seconds: float = field(default=0.0, init=False)
+    parse_seconds: float = field(default=0.0, init=False)
+    handle_seconds: float = field(default=0.0, init=False)
+
+    def __post_init__(self) -> None:
+        if self.callback_every <= 0:
+            raise ValueError("Callback every must be strictly positive")
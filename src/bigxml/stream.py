@@ -1,10 +1,31 @@
-from collections.abc import Generator, Iterable
-from io import IOBase
+from asyncio import AbstractEventLoop, run_coroutine_threadsafe
+from collections.abc import (
+    AsyncIterable,
+    Awaitable,
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+)
+from contextlib import suppress
+from contextvars import ContextVar
+from inspect import iscoroutinefunction
+from io import BufferedIOBase, RawIOBase
+from itertools import cycle
+from mmap import ACCESS_READ, mmap
+from os import PathLike, fstat
+from stat import S_ISREG
 import sys
 from typing import Any, cast
 
-from bigxml.typing import Streamable, SupportsRead
-from bigxml.utils import autostart_generator
+from bigxml.decompress import (
+    MAGIC_FIRST_BYTES,
+    MAGIC_SIZE,
+    Decompressor,
+    get_decompressor,
+)
+from bigxml.typing import Streamable, SupportsAsyncRead, SupportsRead, T
+from bigxml.utils import autostart_generator, iter_in_thread
 
 if sys.version_info < (3, 12):  # pragma: no cover
     from typing_extensions import Buffer
@@ -12,38 +33,145 @@ else:  # pragma: no cover
     from collections.abc import Buffer
 
 
-@autostart_generator
-def _flatten_stream(stream: Streamable) -> Generator[memoryview | None, int, None]:
-    yield None
+def _fill_from(
+    buffer: memoryview, data: memoryview
+) -> Generator[int, memoryview, memoryview]:
+    while data:
+        size = min(len(buffer), len(data))
+        buffer[:size] = data[:size]
+        data = data[size:]
+        buffer = yield size
+    return buffer
+
+
+# event loop in which asynchronous streams are read, see Parser.aiter_from
+ASYNC_STREAMS_LOOP: ContextVar[AbstractEventLoop | None] = ContextVar(
+    "ASYNC_STREAMS_LOOP", default=None
+)
+
+
+def _byte_view(data: Buffer) -> memoryview:
+    # raises TypeError if data does not support the buffer protocol
+    view = memoryview(data)
+    if not view.c_contiguous:
+        # casts are restricted to contiguous views (e.g. not to sliced ones)
+        view = memoryview(view.tobytes())
+    return view.cast("B")
+
+
+def _read_view(data: object) -> memoryview:
+    try:
+        return _byte_view(cast("Buffer", data))
+    except TypeError as ex:
+        if isinstance(data, str):
+            raise TypeError(
+                "Stream read method returned a str, not a bytes-like object."
+                " Open file objects in binary mode."
+            ) from ex
+        raise TypeError(
+            "Stream read method did not return a byte-like object:"
+            f" {type(data).__name__}"
+        ) from ex
+
+
+async def _await(awaitable: Awaitable[T]) -> T:
+    return await awaitable
+
+
+def _flatten_path(
+    path: PathLike[str] | PathLike[bytes], buffer: memoryview
+) -> Generator[int, memoryview, memoryview]:
+    # memory-mapped, then read as bytes-like objects
+    with open(path, "rb") as file:  # noqa: PTH123 # bytes paths allowed
+        stat = fstat(file.fileno())
+        if not (S_ISREG(stat.st_mode) and stat.st_size):
+            # empty files cannot be mapped, and others (pipes, /proc, etc.) may
+            # report a size of zero while having data: read as a file object
+            return (yield from _flatten_stream(file, buffer))
+        with (
+            mmap(file.fileno(), 0, access=ACCESS_READ) as mapped,
+            memoryview(mapped) as data,
+        ):
+            return (yield from _fill_from(buffer, data))
+
+
+def _flatten_async_stream(
+    stream: SupportsAsyncRead[Any] | AsyncIterable[Streamable], buffer: memoryview
+) -> Generator[int, memoryview, memoryview]:
+    loop = ASYNC_STREAMS_LOOP.get()
+    if loop is None:
+        raise TypeError(
+            f"Invalid stream type: {type(stream).__name__}."
+            " Use Parser.aiter_from for asynchronous streams."
+        )
+
+    def wait(awaitable: Awaitable[T]) -> T:
+        return run_coroutine_threadsafe(_await(awaitable), loop).result()
+
+    # async iterator (recursive)
+    if isinstance(stream, AsyncIterable):
+        substreams = aiter(stream)
+        while True:
+            try:
+                substream = wait(anext(substreams))
+            except StopAsyncIteration:
+                return buffer
+            buffer = yield from _flatten_stream(substream, buffer)
+
+    # async file-like
+    while True:
+        data = wait(stream.read(len(buffer)))
+        if not data:
+            return buffer  # EOF
+        buffer = yield from _fill_from(buffer, _read_view(data))
+
+
+def _flatten_stream(
+    stream: Streamable, buffer: memoryview
+) -> Generator[int, memoryview, memoryview]:
+    # the buffers sent are filled with data from the stream, and the number of bytes
+    # written is yielded; the last buffer sent that could not be filled is returned
 
     # buffer protocol (bytes, etc.)
     try:
         # we try-except instead of isinstance(stream, Buffer) for compatibility reasons
-        yield memoryview(cast("Buffer", stream))
-        return  # noqa: TRY300
+        data = _byte_view(cast("Buffer", stream))
     except TypeError:
         pass
+    else:
+        return (yield from _fill_from(buffer, data))
+
+    # paths
+    if isinstance(stream, PathLike):
+        return (yield from _flatten_path(stream, buffer))
+
+    # binary file objects: read directly into the buffer
+    # (no duck typing here since some wrappers expose readinto of the wrapped stream)
+    if isinstance(stream, (BufferedIOBase, RawIOBase)):
+        while True:
+            size = stream.readinto(buffer)
+            if not size:
+                return buffer  # EOF
+            buffer = yield size
+
+    # asynchronous streams
+    if isinstance(stream, AsyncIterable) or iscoroutinefunction(
+        getattr(stream, "read", None)
+    ):
+        return (
+            yield from _flatten_async_stream(
+                cast("SupportsAsyncRead[Any] | AsyncIterable[Streamable]", stream),
+                buffer,
+            )
+        )
 
     # file-like
     if hasattr(stream, "read"):
         while True:
-            size = yield None
-            data = cast("SupportsRead[Any]", stream).read(size)
+            data = cast("SupportsRead[Any]", stream).read(len(buffer))
             if not data:
-                break  # EOF
-            try:
-                yield memoryview(data)
-            except TypeError as ex:
-                if isinstance(data, str):
-                    raise TypeError(
-                        "Stream read method returned a str, not a bytes-like object."
-                        " Open file objects in binary mode."
-                    ) from ex
-                raise TypeError(
-                    "Stream read method did not return a byte-like object:"
-                    f" {type(data).__name__}"
-                ) from ex
-        return
+                return buffer  # EOF
+            buffer = yield from _fill_from(buffer, _read_view(data))
 
     # known invalid type (need to be caught here since they are iterable)
     # we disallow sets to avoid issues with ordering
@@ -63,38 +191,128 @@ def _flatten_stream(stream: Streamable) -> Generator[memoryview | None, int, Non
         raise TypeError(f"Invalid stream type: {type(stream).__name__}") from None
 
     for substream in substreams:
-        yield from _flatten_stream(substream)
+        buffer = yield from _flatten_stream(substream, buffer)
+    return buffer
 
 
-@autostart_generator
-def _convert_to_read(
-    data_stream: Generator[memoryview | None, int, None],
-) -> Generator[bytes, int, None]:
-    size = yield b""
+DECOMPRESS_READ_SIZE = 256 * 1024
+
+
+def _decompress(
+    decompressor_type: Callable[[], Decompressor],
+    raw: Generator[int, memoryview, memoryview],
+    compressed: memoryview,
+    data: memoryview,
+    buffer: memoryview,
+) -> Generator[int, memoryview, None]:
+    # compressed data is read in its own buffer, and decompressed in the buffers sent
+    # several members (or streams, or frames) can follow each other
+    decompressor = decompressor_type()
+    fed = False
+    padding = False  # zero bytes after a member are skipped, as gzip.GzipFile does
     while True:
+        if padding:
+            stripped = data.tobytes().lstrip(b"\0")
+            data = data[len(data) - len(stripped) :]
+            padding = not data
+        output = decompressor.decompress(data, len(buffer))
+        fed = fed or bool(data)
+        data = compressed[:0]
+        if output:
+            buffer = yield from _fill_from(buffer, memoryview(output))
+        if decompressor.eof:
+            data = memoryview(decompressor.unused_data)
+            decompressor = decompressor_type()
+            fed = False
+            padding = True
+        elif decompressor.needs_input:
+            try:
+                data = compressed[: raw.send(compressed)]
+            except StopIteration:
+                break
+    if fed:
+        raise EOFError(
+            "Compressed file ended before the end-of-stream marker was reached"
+        )
+
+
+@autostart_generator
+def _fill_buffers(streams: Streamable) -> Generator[int, memoryview, None]:
+    buffer = yield 0
+    raw = _flatten_stream(streams, buffer)
+    try:
         try:
-            buffer = data_stream.send(size)
+            length = next(raw)
         except StopIteration:
-            break
+            return
+        # compressed data is detected by its first bytes, which cannot start XML
+        if buffer[0] in MAGIC_FIRST_BYTES:
+            data = bytearray(buffer[:length])
+            compressed = memoryview(bytearray(DECOMPRESS_READ_SIZE))
+            with suppress(StopIteration):
+                while len(data) < MAGIC_SIZE:
+                    data += compressed[: raw.send(compressed)]
+            decompressor_type = get_decompressor(data)
+            if decompressor_type is not None:
+                yield from _decompress(
+                    decompressor_type, raw, compressed, memoryview(data), buffer
+                )
+                return
+            buffer = yield from _fill_from(buffer, memoryview(data))
+        else:
+            buffer = yield length
+        while True:
+            try:
+                size = raw.send(buffer)
+            except StopIteration:
+                return
+            buffer = yield size
+    finally:
+        raw.close()
 
-        while buffer:
-            data, buffer = buffer[:size], buffer[size:]
-            size = yield data.tobytes()
 
-    while True:
-        yield b""
+READ_SIZE_DEFAULT = 16 * 1024
+READ_SIZE_MIN = 4 * 1024  # when adaptive
+READ_SIZE_MAX = 256 * 1024  # when adaptive
 
 
-class StreamChain(IOBase):
-    def __init__(self, *streams: Streamable) -> None:
-        super().__init__()
-        self._read = _convert_to_read(_flatten_stream(streams))
+def _read_chunks(
+    streams: tuple[Streamable, ...], read_size: int | None, buffers_count: int
+) -> Iterator[memoryview]:
+    # the chunks are views of buffers used in turn
+    # when read_size is None, it grows while streams fill whole chunks (e.g. bytes,
+    # local files) and shrinks when they provide much less data than asked
+    adaptive = read_size is None
+    size = READ_SIZE_DEFAULT if read_size is None else read_size
+    buffers = cycle(
+        [
+            memoryview(bytearray(READ_SIZE_MAX if adaptive else size))
+            for _ in range(buffers_count)
+        ]
+    )
+    fill = _fill_buffers(streams)
+    while True:
+        buffer = next(buffers)
+        try:
+            length = fill.send(buffer[:size])
+        except StopIteration:
+            return
+        yield buffer[:length]
+        if adaptive:
+            if length == size:
+                size = min(size * 2, READ_SIZE_MAX)
+            elif length < size // 4:
+                size = max(size // 2, READ_SIZE_MIN)
 
-    def read(self, size: int | None = None) -> bytes:
-        if not isinstance(size, int) or size <= 0:
-            raise NotImplementedError("Read size must be strictly positive")
-        return self._read.send(size)
 
-    @staticmethod
-    def readable() -> bool:
-        return True
+def iter_chunks(
+    *streams: Streamable, read_size: int | None, prefetch: int = 0
+) -> Iterator[memoryview]:
+    # the chunks are views of reused buffers: each one is only valid until the next
+    # one is requested
+    # when prefetch is set, up to that many chunks are read ahead in a worker thread
+    # (I/O and decompression release the GIL, so they can overlap with parsing)
+    if not prefetch:
+        return _read_chunks(streams, read_size, 1)
+    # one buffer for each chunk waiting, plus the ones being filled and consumed
+    return iter_in_thread(_read_chunks(streams, read_size, prefetch + 2), prefetch)
@@ -1,4 +1,5 @@
-from collections.abc import Callable, Iterable, Iterator
+from collections.abc import AsyncIterable, Callable, Iterable, Iterator
+from os import PathLike
 import sys
 from typing import Any, ParamSpec, Protocol, TypeVar
 
@@ -14,13 +15,30 @@ F = TypeVar("F", bound=Callable[..., Any])
 K = TypeVar("K", bound=type[Any])
 
 T_co = TypeVar("T_co", covariant=True)
+T_contra = TypeVar("T_contra", contravariant=True)
 
 
 class SupportsRead(Protocol[T_co]):
     def read(self, size: int | None = None) -> T_co: ...  # pragma: no cover
 
 
-Streamable = Buffer | SupportsRead[bytes] | Iterable["Streamable"]
+class SupportsAsyncRead(Protocol[T_co]):
+    async def read(self, size: int = -1) -> T_co: ...  # pragma: no cover
+
+
+class SupportsWrite(Protocol[T_contra]):
+    def write(self, data: T_contra, /) -> object: ...  # pragma: no cover
+
+
+Streamable = (
+    Buffer
+    | SupportsRead[bytes]
+    | SupportsAsyncRead[bytes]
+    | PathLike[str]
+    | PathLike[bytes]
+    | Iterable["Streamable"]
+    | AsyncIterable["Streamable"]
+)
 
 
 class ClassHandlerWithCustomWrapper0(Protocol[T_co]):
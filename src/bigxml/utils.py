@@ -1,9 +1,15 @@
+from asyncio import Queue, get_running_loop
 from collections import deque
-from collections.abc import Callable, Generator, Iterable, Iterator
-from functools import wraps
-from inspect import Parameter, signature
-import re
+from collections.abc import AsyncGenerator, Callable, Generator, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from contextvars import copy_context
+from functools import lru_cache, wraps
+from inspect import Parameter, ismethod, signature
+from queue import SimpleQueue
+from sys import intern
+from threading import Event, Semaphore, Thread
 from typing import cast
+from weakref import WeakKeyDictionary
 
 from bigxml.typing import P, T, U
 
@@ -34,14 +40,19 @@ class IterWithRollback(Iterator[T]):
         return self._last_item
 
 
-_EXTRACT_NAMESPACE_REGEX = re.compile(r"^\{([^}]*)\}(.*)$")
+EXTRACT_NAMESPACE_NAME_CACHE_SIZE = 4096
 
 
+# tag and attribute names repeat a lot in documents: results are cached,
+# and interned so that nodes share the same string objects
+# hits and misses can be seen with extract_namespace_name.cache_info()
+@lru_cache(maxsize=EXTRACT_NAMESPACE_NAME_CACHE_SIZE)
 def extract_namespace_name(name: str) -> tuple[str, str]:
-    match = _EXTRACT_NAMESPACE_REGEX.match(name)
-    if match:
-        return cast("tuple[str, str]", match.groups())
-    return ("", name)
+    if name.startswith("{"):
+        namespace, sep, local_name = name[1:].partition("}")
+        if sep:
+            return (intern(namespace), intern(local_name))
+    return ("", intern(name))
 
 
 def last_item_or_none(iterable: Iterable[T]) -> T | None:
@@ -74,7 +85,7 @@ def transform_to_iterator(
     return wrapped
 
 
-def get_mandatory_params(fct: Callable[..., object]) -> tuple[str, ...]:
+def _compute_mandatory_params(fct: Callable[..., object]) -> tuple[str, ...]:
     try:
         sig = signature(fct)
     except (ValueError, TypeError):  # pragma: no cover
@@ -92,6 +103,30 @@ def get_mandatory_params(fct: Callable[..., object]) -> tuple[str, ...]:
     )
 
 
+# signatures do not change, so they are cached per function or class
+# bound methods are cached on their underlying function in a separate mapping
+_MANDATORY_PARAMS_CACHE: WeakKeyDictionary[object, tuple[str, ...]] = (
+    WeakKeyDictionary()
+)
+_MANDATORY_PARAMS_METHOD_CACHE: WeakKeyDictionary[object, tuple[str, ...]] = (
+    WeakKeyDictionary()
+)
+
+
+def get_mandatory_params(fct: Callable[..., object]) -> tuple[str, ...]:
+    if ismethod(fct):
+        cache, key = _MANDATORY_PARAMS_METHOD_CACHE, fct.__func__
+    else:
+        cache, key = _MANDATORY_PARAMS_CACHE, fct
+    try:
+        return cache[key]
+    except KeyError:
+        params = cache[key] = _compute_mandatory_params(fct)
+    except TypeError:
+        return _compute_mandatory_params(fct)  # cannot be weakly referenced
+    return params
+
+
 def autostart_generator(
     fct: Callable[P, Generator[T, U, None]],
 ) -> Callable[P, Generator[T, U, None]]:
@@ -102,3 +137,126 @@ def autostart_generator(
         return generator
 
     return wrapped
+
+
+def iter_in_thread(iterable: Iterable[T], max_pending: int) -> Generator[T, None, None]:
+    # items are generated in a worker thread, at most max_pending of them being
+    # waiting to be consumed
+    queue: SimpleQueue[tuple[bool, object]] = SimpleQueue()
+    slots = Semaphore(max_pending)
+    stopping = Event()
+
+    def produce() -> None:
+        iterator = iter(iterable)
+        try:
+            for item in iterator:
+                slots.acquire()
+                if stopping.is_set():
+                    return
+                queue.put((True, item))
+        except BaseException as ex:  # noqa: BLE001 # raised in the consumer
+            queue.put((False, ex))
+        else:
+            queue.put((False, None))
+        finally:
+            if isinstance(iterator, Generator):
+                iterator.close()
+
+    # the context is copied so that context variables are available in the thread
+    producer = Thread(target=copy_context().run, args=(produce,), daemon=True)
+    producer.start()
+    try:
+        while True:
+            is_item, value = queue.get()
+            if not is_item:
+                if value is not None:
+                    raise cast("BaseException", value)
+                return
+            slots.release()
+            yield cast("T", value)
+    finally:
+        stopping.set()
+        slots.release()  # in case the worker is waiting for a slot
+        producer.join()
+
+
+def _next_done(pending: deque[Future[T]], *, ordered: bool) -> Future[T]:
+    if not ordered:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        future = next(iter(done))
+        pending.remove(future)
+        return future
+    return pending.popleft()
+
+
+def map_in_executor(
+    executor: Executor,
+    fct: Callable[[U], Iterable[T]],
+    iterable: Iterable[U],
+    *,
+    max_pending: int,
+    ordered: bool,
+) -> Iterator[T]:
+    # fct is called on each item in the executor, and the items it returns are
+    # yielded as soon as available or in order; at most max_pending calls are
+    # submitted at a time
+    pending: deque[Future[Iterable[T]]] = deque()
+    try:
+        for item in iterable:
+            if len(pending) >= max_pending:
+                yield from _next_done(pending, ordered=ordered).result()
+            pending.append(executor.submit(fct, item))
+        while pending:
+            yield from _next_done(pending, ordered=ordered).result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+async def aiter_in_thread(
+    iterable: Iterable[T], max_pending: int
+) -> AsyncGenerator[T, None]:
+    # items are generated in a worker thread, at most max_pending of them being
+    # waiting to be consumed in the event loop
+    loop = get_running_loop()
+    queue: Queue[tuple[bool, object]] = Queue()
+    slots = Semaphore(max_pending)
+    stopping = Event()
+    stopped = loop.create_future()
+
+    def produce() -> None:
+        iterator = iter(iterable)
+        try:
+            for item in iterator:
+                slots.acquire()
+                if stopping.is_set():
+                    return
+                loop.call_soon_threadsafe(queue.put_nowait, (True, item))
+        except BaseException as ex:  # noqa: BLE001 # raised in the event loop
+            loop.call_soon_threadsafe(queue.put_nowait, (False, ex))
+        else:
+            loop.call_soon_threadsafe(queue.put_nowait, (False, None))
+        finally:
+            if isinstance(iterator, Generator):
+                iterator.close()
+            loop.call_soon_threadsafe(stopped.set_result, None)
+
+    # a dedicated thread rather than the default executor of the event loop: the
+    # producer holds its thread until the end of the iteration, while async streams
+    # may need the executor to be read (e.g. with asyncio.to_thread)
+    # the context is copied so that context variables are available in the thread
+    producer = Thread(target=copy_context().run, args=(produce,), daemon=True)
+    producer.start()
+    try:
+        while True:
+            is_item, value = await queue.get()
+            if not is_item:
+                if value is not None:
+                    raise cast("BaseException", value)
+                return
+            slots.release()
+            yield cast("T", value)
+    finally:
+        stopping.set()
+        slots.release()  # in case the worker is waiting for a slot
+        await stopped  # the event loop keeps running while the worker stops
@@ -47,6 +47,22 @@ def big_stream(ram_used: Callable[[], float]) -> Iterator[bytes]:
     yield b"</root>"
 
 
+def many_records_stream(ram_used: Callable[[], float]) -> Iterator[bytes]:
+    ram_limit: float | None = None
+
+    yield b"<root>\n"
+
+    for i in range(10):  # 1k * 10 -> 10k records
+        yield b"".join(b"<r><nb>%d</nb></r>\n" % (i * 1_000 + j) for j in range(1_000))
+
+        if ram_limit is None:
+            ram_limit = ram_used() * 2  # should be enough
+        else:
+            assert ram_used() < ram_limit, "Consumes too much RAM"
+
+    yield b"</root>"
+
+
 def test_with_handler(
     ram_usage: Callable[[], float],
 ) -> None:
@@ -65,3 +81,23 @@ def test_no_handler(
 ) -> None:
     items: Iterator[object] = Parser(big_stream(ram_usage)).iter_from()
     assert not list(items)
+
+
+def test_many_records_with_handler(
+    ram_usage: Callable[[], float],
+) -> None:
+    @xml_handle_text("root", "r", "nb")
+    def handler(node: XMLText) -> Iterator[int]:
+        yield int(node.text)
+
+    items = Parser(many_records_stream(ram_usage)).iter_from(handler)
+
+    for exp, item in enumerate(items):
+        assert item == exp
+
+
+def test_many_records_no_handler(
+    ram_usage: Callable[[], float],
+) -> None:
+    items: Iterator[object] = Parser(many_records_stream(ram_usage)).iter_from()
+    assert not list(items)
@@ -1,4 +1,5 @@
-from collections.abc import Iterable, Iterator
+import asyncio
+from collections.abc import AsyncGenerator, Iterable, Iterator
 from dataclasses import dataclass
 import sys
 
@@ -331,3 +332,15 @@ def test_mixed_callable_class() -> None:
     value = Parser(XML).return_from(text_handler2, WithSubHandler2)
     assert_type(value, WithSubHandler2 | None)
     assert value == WithSubHandler2("~\n~")
+
+
+# async
+
+
+def test_async() -> None:
+    async def run() -> list[str]:
+        iterator = Parser(XML).aiter_from(element_handler)
+        assert_type(iterator, AsyncGenerator[str, None])
+        return [item async for item in iterator]
+
+    assert asyncio.run(run()) == ["one", "two", "three"]
@@ -1,11 +1,15 @@
+from contextlib import nullcontext
 from datetime import datetime
 from lzma import LZMAFile
 from pathlib import Path
 
+import pytest
+
 from bigxml import Parser, XMLText, xml_handle_element, xml_handle_text
 
 
-def test_wikipedia_export() -> None:
+@pytest.mark.parametrize("decompress", [True, False], ids=["lzma", "native"])
+def test_wikipedia_export(decompress: bool) -> None:
     @xml_handle_element("mediawiki", "page", "revision")
     class Revision:
         def __init__(self) -> None:
@@ -20,7 +24,8 @@ def test_wikipedia_export() -> None:
         def handle_date(self, node: XMLText) -> None:
             self.date = datetime.strptime(node.text, "%Y-%m-%dT%H:%M:%SZ").astimezone()
 
-    with LZMAFile(Path(__file__).parent / "wikipedia_python_export.xml.xz") as stream:
+    path = Path(__file__).parent / "wikipedia_python_export.xml.xz"
+    with LZMAFile(path) if decompress else nullcontext(path) as stream:
         items = list(Parser(stream).iter_from(Revision))
         assert len(items) == 1000
         assert all(isinstance(item, Revision) for item in items)
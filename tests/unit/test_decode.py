@@ -0,0 +1,87 @@
+from base64 import b64encode
+from collections.abc import Iterator
+from io import BytesIO
+
+import pytest
+
+from bigxml.decode import iter_decoded, write_decoded
+from bigxml.handler_marker import xml_handle_text
+from bigxml.nodes import XMLText
+from bigxml.parser import Parser
+
+DATA = bytes(range(256)) * 10
+
+
+def split_text(text: str, size: int) -> list[str]:
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, 1024, 100_000])
+@pytest.mark.parametrize(
+    ["encoding", "text", "data"],
+    [
+        ("base64", b64encode(DATA).decode(), DATA),
+        ("base64", b64encode(DATA[:-1]).decode(), DATA[:-1]),
+        ("base64", "\n".join(split_text(b64encode(DATA).decode(), 76)), DATA),
+        ("hex", DATA.hex(), DATA),
+        ("hex", DATA.hex().upper(), DATA),
+        ("hex", DATA.hex(" ", 4), DATA),
+    ],
+    ids=["base64", "base64 padding", "base64 lines", "hex", "hex upper", "hex spaces"],
+)
+def test_iter_decoded(encoding: str, text: str, data: bytes, size: int) -> None:
+    assert b"".join(iter_decoded(split_text(text, size), encoding)) == data
+
+
+def test_iter_decoded_empty() -> None:
+    assert not list(iter_decoded([]))
+    assert not list(iter_decoded(["", "  \n  "], "hex"))
+
+
+@pytest.mark.parametrize(
+    ["encoding", "chunks"],
+    [
+        ("base64", ["QUJD", "QU"]),
+        ("base64", ["QUJ", "*"]),
+        ("base64", ["QQ==", "QUJD"]),
+        ("base64", ["QQ", "==QUJD"]),
+        ("base64", ["QUJDé"]),
+        ("hex", ["ab", "c"]),
+        ("hex", ["ab", "cg"]),
+    ],
+    ids=[
+        "base64 missing",
+        "base64 invalid",
+        "base64 after padding",
+        "base64 after padding in chunk",
+        "base64 non-ascii",
+        "hex missing",
+        "hex invalid",
+    ],
+)
+def test_iter_decoded_invalid(encoding: str, chunks: list[str]) -> None:
+    with pytest.raises(ValueError):  # noqa: PT011
+        list(iter_decoded(chunks, encoding))
+
+
+def test_iter_decoded_invalid_encoding() -> None:
+    with pytest.raises(ValueError, match="Encoding must be one of: base64, hex"):
+        next(iter_decoded(["QUJD"], "rot13"))
+
+
+def test_write_decoded() -> None:
+    sink = BytesIO()
+    assert write_decoded(split_text(DATA.hex(), 100), sink, "hex") == len(DATA)
+    assert sink.getvalue() == DATA
+
+
+def test_write_decoded_from_parser() -> None:
+    @xml_handle_text("root", "attachment")
+    def handler(node: XMLText) -> Iterator[int]:
+        yield write_decoded(node.iter_chunks(), sink)
+
+    sink = BytesIO()
+    xml = b"<root><attachment>\n%s\n</attachment></root>" % b64encode(DATA)
+    parser = Parser(xml, read_size=100, chunked_texts=True)
+    assert list(parser.iter_from(handler)) == [len(DATA)]
+    assert sink.getvalue() == DATA
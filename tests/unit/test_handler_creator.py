@@ -2,12 +2,19 @@ from collections.abc import Callable, Iterable, Iterator
 from contextlib import suppress
 from dataclasses import dataclass
 from functools import partial
+import gc
+from inspect import getmembers
 from typing import TYPE_CHECKING, Any, cast
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
+from weakref import ref
 
 import pytest
 
-from bigxml.handler_creator import CLASS_HANDLER_METHOD_NAME, create_handler
+from bigxml.handler_creator import (
+    CLASS_HANDLER_METHOD_NAME,
+    create_handler,
+    get_handler_tree,
+)
 from bigxml.handler_marker import xml_handle_element, xml_handle_text
 from bigxml.nodes import XMLElement, XMLElementAttributes, XMLText
 
@@ -798,6 +805,240 @@ def test_class_extends_builtin_list_without_init() -> None:
     assert list(handler(nodes[0])) == [[nodes[1]]]
 
 
+def test_class_members_inspected_once() -> None:
+    @xml_handle_element("x")
+    class Handler:
+        def __init__(self) -> None:
+            self.nodes: list[XMLElement] = []
+
+        @xml_handle_element("a")
+        def handle0(self, node: XMLElement) -> None:
+            self.nodes.append(node)
+
+        def xml_handler(self) -> Iterator[list[XMLElement]]:
+            yield self.nodes
+
+    handler = create_handler(Handler)
+    with patch(
+        "bigxml.handler_creator.getmembers", side_effect=getmembers
+    ) as getmembers_mock:
+        for _ in range(3):
+            nodes = create_nodes("x", "a")
+            assert list(handler(nodes[0])) == [[nodes[1]]]
+    assert getmembers_mock.call_count == 1
+
+
+def test_class_instance_attribute_shadows_handler() -> None:
+    @xml_handle_element("x")
+    class Handler:
+        def __init__(self) -> None:
+            setattr(self, "handle0", None)  # noqa: B010
+
+        @xml_handle_element("a")
+        @staticmethod
+        def handle0(node: XMLElement) -> Iterator[tuple[str, XMLElement]]:
+            yield ("0", node)  # pragma: no cover
+
+        def xml_handler(self, items: Iterator[object]) -> Iterator[object]:
+            yield from items
+            yield self.handle0
+
+    nodes = create_nodes("x", "a")
+    handler = create_handler(Handler)
+    assert list(handler(nodes[0])) == [None]
+
+
+def test_class_property_handler() -> None:
+    @xml_handle_element("a")
+    class SubHandler:
+        @xml_handle_element("b")
+        @staticmethod
+        def handle0(node: XMLElement) -> Iterator[tuple[str, XMLElement]]:
+            yield ("0", node)
+
+    @xml_handle_element("x")
+    class Handler:
+        @property
+        def sub(self) -> SubHandler:
+            return SubHandler()
+
+        @property
+        def other(self) -> str:
+            return "other"
+
+        @staticmethod
+        def xml_handler(items: Iterator[object]) -> Iterator[object]:
+            yield from items
+
+    nodes = create_nodes("x", "a", "b")
+    handler = create_handler(Handler)
+    assert list(handler(nodes[0])) == [("0", nodes[2])]
+
+
+def test_class_callable_instance() -> None:
+    @xml_handle_element("x")
+    class Handler:
+        @xml_handle_element("a")
+        @staticmethod
+        def handle0(node: XMLElement) -> Iterator[tuple[str, XMLElement]]:
+            yield ("0", node)  # pragma: no cover
+
+        @staticmethod
+        def __call__(node: XMLElement) -> Iterator[tuple[str, XMLElement]]:
+            yield ("call", node)
+
+        @staticmethod
+        def xml_handler(items: Iterator[object]) -> Iterator[object]:
+            yield from items
+
+    nodes = create_nodes("x", "a")
+    handler = create_handler(Handler)
+    assert list(handler(nodes[0])) == [("call", nodes[1])]
+
+
+def test_class_conflicting_handlers() -> None:
+    @xml_handle_element("x")
+    class Handler:
+        @xml_handle_element("a")
+        @staticmethod
+        def handle0(node: XMLElement) -> Iterator[tuple[str, XMLElement]]:
+            yield ("0", node)  # pragma: no cover
+
+        @xml_handle_element("a")
+        @staticmethod
+        def handle1(node: XMLElement) -> Iterator[tuple[str, XMLElement]]:
+            yield ("1", node)  # pragma: no cover
+
+        @staticmethod
+        def xml_handler(items: Iterator[object]) -> Iterator[object]:
+            yield from items
+            yield "end"
+
+    nodes = create_nodes("x", "a")
+    handler = create_handler(Handler)
+    assert list(handler(nodes[0])) == ["end"]
+
+
+#
+# Cache
+#
+
+
+def test_cache_same_handlers() -> None:
+    @xml_handle_element("a")
+    def handle0(node: XMLElement) -> Iterator[tuple[str, XMLElement]]:
+        yield ("0", node)
+
+    @xml_handle_element("b")
+    class Handler:
+        @xml_handle_element("c")
+        def handle1(self, node: XMLElement) -> Iterator[tuple[str, XMLElement]]:
+            yield ("1", node)
+
+    for handlers in (
+        (),
+        (handle0,),
+        (handle0, Handler),
+        (handle0, "x", ("y", "z")),
+    ):
+        assert create_handler(*handlers) is create_handler(*handlers)
+    assert create_handler(handle0) is not create_handler(handle0, Handler)
+
+
+@pytest.mark.parametrize(
+    "handlers",
+    [
+        (["a", "b"],),
+        (partial(lambda _: None),),
+    ],
+    ids=str,
+)
+def test_cache_mutable_handlers(handlers: tuple[object, ...]) -> None:
+    assert create_handler(*handlers) is not create_handler(*handlers)
+
+
+def test_cache_per_node_handlers() -> None:
+    # bound methods and closures are usually created for each node, and must not be
+    # kept alive by the cache
+    class Record:
+        def handle(self, node: XMLElement) -> Iterator[tuple[str, XMLElement]]:
+            yield ("method", node)
+
+    nodes = create_nodes("a")
+
+    def handle_record(*, use_method: bool) -> "ref[Record]":
+        record = Record()
+        handler: Callable[[XMLElement], Iterable[object]]
+        if use_method:
+            handler = record.handle
+        else:
+            handler = lambda node: [("closure", node, record)]  # noqa: E731
+        assert create_handler(handler) is not create_handler(handler)
+        assert len(list(create_handler(handler)(nodes[0]))) == 1
+        return ref(record)
+
+    for use_method in (True, False):
+        record_ref = handle_record(use_method=use_method)
+        gc.collect()
+        assert record_ref() is None
+
+
+def test_cache_instance_handler() -> None:
+    class Handler:
+        @xml_handle_element("a")
+        @staticmethod
+        def handle0(node: XMLElement) -> Iterator[tuple[str, XMLElement]]:
+            yield ("0", node)
+
+    instance = Handler()
+    nodes = create_nodes("a")
+    assert list(create_handler(instance)(nodes[0])) == [("0", nodes[0])]
+
+    # handlers of instances can change over time
+    instance.handle0 = xml_handle_element("a")(  # type: ignore[method-assign]
+        lambda node: [("1", node)]
+    )
+    assert list(create_handler(instance)(nodes[0])) == [("1", nodes[0])]
+
+
+#
+# Handler tree
+#
+
+
+def test_get_handler_tree() -> None:
+    def catchall(node: XMLElement | XMLText) -> Iterator[XMLElement | XMLText]:
+        yield node
+
+    @xml_handle_element("a")
+    def handle0(node: XMLElement) -> Iterator[XMLElement]:
+        yield node
+
+    # plain callable
+    handler_tree, instance = get_handler_tree(catchall)
+    assert handler_tree.handler is catchall
+    assert not handler_tree.children
+    assert instance is None
+
+    # created handler
+    handler = create_handler(handle0)
+    handler_tree, instance = get_handler_tree(handler)
+    assert handler_tree.handle == handler
+    assert list(handler_tree.children) == ["a"]
+    assert instance is None
+
+    # bound handler
+    marker = object()
+    handler_tree, instance = get_handler_tree(handler_tree.bind(marker))
+    assert handler_tree.handle == handler
+    assert instance is marker
+
+    # handler created from created handler
+    handler_tree, instance = get_handler_tree(create_handler(handler))
+    assert handler_tree.handle == handler
+    assert instance is None
+
+
 #
 # Invalid handler
 #
@@ -1,4 +1,5 @@
 from contextlib import AbstractContextManager, nullcontext
+from unittest.mock import patch
 
 import pytest
 
@@ -91,5 +92,15 @@ def test_eq() -> None:
 
 @pytest.mark.parametrize("key", [r"{aaa", r"{aaa}{bbb"])
 def test_invalid_key(key: str) -> None:
+    attributes = XMLElementAttributes({key: "foo"})  # lazy
     with pytest.raises(ValueError, match=r"Invalid key: '.*'"):
-        XMLElementAttributes({key: "foo"})
+        attributes["foo"]
+
+
+def test_lazy() -> None:
+    with patch("bigxml.nodes.extract_namespace_name", side_effect=AssertionError):
+        attributes = XMLElementAttributes({"{xxx}aaa": "0", "bbb": "1"})
+
+    assert len(attributes) == 2
+    assert attributes["aaa"] == "0"
+    assert attributes["{}bbb"] == "1"
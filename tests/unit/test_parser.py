@@ -1,5 +1,6 @@
 from collections.abc import Callable, Iterator
 from itertools import count
+from unittest.mock import patch
 
 import pytest
 
@@ -165,6 +166,71 @@ def test_out_of_order() -> None:
         first_node.text  # noqa: B018
 
 
+def test_nodes_not_handled_are_not_created() -> None:
+    @xml_handle_element("root", "b")
+    def handler(node: XMLElement) -> Iterator[str]:
+        yield node.text
+
+    parser = Parser(b"<root>Hello<a><b>no</b></a><b>yes</b>World<c /></root>")
+    with (
+        patch.object(
+            XMLElement, "_from_parser", wraps=XMLElement._from_parser
+        ) as elem_mock,
+        patch.object(XMLText, "_from_parser", wraps=XMLText._from_parser) as text_mock,
+    ):
+        assert list(parser.iter_from(handler)) == ["yes"]
+    assert [call.args[0] for call in elem_mock.call_args_list] == ["root", "b"]
+    assert text_mock.call_count == 0  # text inside <b> is read without creating nodes
+
+
+@pytest.mark.parametrize("read_size", [1, 7, 1024])
+def test_text(read_size: int) -> None:
+    @xml_handle_element("root", "a")
+    def handler(node: XMLElement) -> Iterator[str]:
+        yield node.text
+
+    xml = (
+        b"<root>skip<a> Hello <b>big<c/></b><b>\nnew <c>world</c>!</b> </a>skip"
+        b"<a>x<b />y</a><a /><a>  </a><a><b><c>deep</c></b></a>skip</root>"
+    )
+    parser = Parser(xml, read_size=read_size)
+    assert list(parser.iter_from(handler)) == [
+        "Hello big new world!",
+        "xy",
+        "",
+        "",
+        "deep",
+    ]
+
+
+def test_nodes_slots() -> None:
+    @xml_handle_element("root")
+    def handler(node: XMLElement) -> Iterator[XMLElement | XMLText]:
+        yield node
+        yield from node.iter_from(lambda n: (n,))
+
+    nodes = list(Parser(b"<root>Hello<foo /></root>").iter_from(handler))
+    assert [type(node) for node in nodes] == [XMLElement, XMLText, XMLElement]
+    for node in nodes:
+        assert not hasattr(node, "__dict__")
+
+
+def test_nodes_parents_lazy() -> None:
+    def handler(node: XMLElement | XMLText) -> Iterator[XMLElement | XMLText]:
+        yield node
+        if isinstance(node, XMLElement):
+            yield from node.iter_from(handler)
+
+    nodes = list(Parser(b"<a><b><c><d>x</d></c></b><e /></a>").iter_from(handler))
+    a, b, c, d, x, e = nodes
+    # parents are computed on access, starting from the deepest node
+    assert x.parents == (a, b, c, d)
+    assert c.parents == (a, b)
+    assert e.parents == (a,)
+    assert a.parents == ()
+    assert x.parents[2] is c
+
+
 def test_many_small_streams(
     handler: HANDLER_TYPE,
 ) -> None:
@@ -186,6 +252,48 @@ def test_many_small_streams(
     ]
 
 
+@pytest.mark.parametrize("read_size", [None, 1, 7, 1024])
+def test_read_size(
+    handler: HANDLER_TYPE,
+    read_size: int | None,
+) -> None:
+    xml = b"<root>Hello<foo />World</root>"
+
+    nodes = [text_h_node, elem_f_node, text_w_node]
+
+    @xml_handle_element("root")
+    def root_handler(
+        node: XMLElement,
+    ) -> Iterator[tuple[str, XMLElement | XMLText]]:
+        yield from node.iter_from(handler)
+
+    parser = Parser(xml, read_size=read_size)
+    assert list(parser.iter_from(root_handler)) == [
+        (f"handler-yield-{i}", node) for i, node in enumerate(nodes)
+    ]
+
+
+def test_invalid_read_size() -> None:
+    with pytest.raises(ValueError, match="Read size must be strictly positive"):
+        Parser(b"<root />", read_size=0)
+
+
+@pytest.mark.parametrize("prefetch", [1, 4])
+def test_prefetch(prefetch: int) -> None:
+    @xml_handle_element("root", "item")
+    def handler(node: XMLElement) -> Iterator[str]:
+        yield node.text
+
+    xml = [b"<root>", *(b"<item>%d</item>" % i for i in range(100)), b"</root>"]
+    parser = Parser(xml, read_size=7, prefetch=prefetch)
+    assert list(parser.iter_from(handler)) == [str(i) for i in range(100)]
+
+
+def test_invalid_prefetch() -> None:
+    with pytest.raises(ValueError, match="Prefetch must be positive"):
+        Parser(b"<root />", prefetch=-1)
+
+
 def test_insecurely_allow_entities(
     handler: HANDLER_TYPE,
 ) -> None:
@@ -0,0 +1,175 @@
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import aclosing
+from io import BytesIO
+
+import pytest
+
+from bigxml.exceptions import BigXmlError
+from bigxml.handler_marker import xml_handle_text
+from bigxml.nodes import XMLText
+from bigxml.parser import Parser
+from bigxml.typing import Streamable
+
+
+@xml_handle_text("root", "item")
+def handler(node: XMLText) -> Iterator[str]:
+    yield node.text
+
+
+async def async_chunks(*chunks: Streamable) -> AsyncIterator[Streamable]:
+    for chunk in chunks:
+        await asyncio.sleep(0)
+        yield chunk
+
+
+class AsyncReader:
+    def __init__(self, data: bytes) -> None:
+        self.stream = BytesIO(data)
+        self.sizes: list[int] = []
+
+    async def read(self, size: int = -1) -> bytes:
+        await asyncio.sleep(0)
+        self.sizes.append(size)
+        return self.stream.read(size)
+
+
+class ThreadReader:
+    # reads in the default executor of the event loop
+    def __init__(self, data: bytes) -> None:
+        self.stream = BytesIO(data)
+
+    async def read(self, size: int = -1) -> bytes:
+        return await asyncio.to_thread(self.stream.read, size)
+
+
+def collect(parser: Parser) -> list[str]:
+    async def run() -> list[str]:
+        return [item async for item in parser.aiter_from(handler)]
+
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize(
+    "streams",
+    [
+        (b"<root><item>a</item><item>b</item></root>",),
+        (async_chunks(b"<root><item>a", b"</item><item>b</item></root>"),),
+        (
+            async_chunks(
+                b"<root>",
+                async_chunks(b"<item>a</item>"),
+                [b"<item>b</item>"],
+                b"</root>",
+            ),
+        ),
+        (b"<root>", AsyncReader(b"<item>a</item><item>b</item>"), b"</root>"),
+    ],
+    ids=["sync", "async-iterable", "nested", "async-read"],
+)
+def test_aiter_from(streams: tuple[Streamable, ...]) -> None:
+    assert collect(Parser(*streams)) == ["a", "b"]
+
+
+def test_async_read_size() -> None:
+    reader = AsyncReader(b"<root><item>a</item><item>b</item></root>")
+    assert collect(Parser(reader, read_size=16)) == ["a", "b"]
+    assert reader.sizes == [16, 16, 16, 16]
+
+
+def test_async_prefetch() -> None:
+    parser = Parser(
+        async_chunks(b"<root><item>a", b"</item><item>b</item></root>"), prefetch=2
+    )
+    assert collect(parser) == ["a", "b"]
+
+
+def test_async_stream_with_iter_from() -> None:
+    parser = Parser(async_chunks(b"<root />"))
+    with pytest.raises(TypeError, match=r"Use Parser\.aiter_from"):
+        list(parser.iter_from(handler))
+
+
+def test_parse_error() -> None:
+    parser = Parser(async_chunks(b"<root><item>a</item><item>b</root>"))
+    with pytest.raises(BigXmlError, match="Mismatched tag"):
+        collect(parser)
+
+
+def test_handler_error() -> None:
+    @xml_handle_text("root", "item")
+    def failing_handler(node: XMLText) -> None:
+        raise ValueError(node.text)
+
+    async def run() -> None:
+        parser = Parser(async_chunks(b"<root><item>oops</item></root>"))
+        async for _ in parser.aiter_from(failing_handler):
+            pass  # pragma: no cover
+
+    with pytest.raises(ValueError, match="oops"):
+        asyncio.run(run())
+
+
+def test_event_loop_not_blocked() -> None:
+    async def slow_chunks() -> AsyncIterator[bytes]:
+        yield b"<root>"
+        for i in range(5):
+            await asyncio.sleep(0.01)
+            yield b"<item>%d</item>" % i
+        yield b"</root>"
+
+    async def run() -> tuple[list[str], int]:
+        ticks = 0
+
+        async def tick() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.001)
+
+        ticker = asyncio.create_task(tick())
+        items = [item async for item in Parser(slow_chunks()).aiter_from(handler)]
+        ticker.cancel()
+        return items, ticks
+
+    items, ticks = asyncio.run(run())
+    assert items == ["0", "1", "2", "3", "4"]
+    assert ticks > 10
+
+
+def test_stop_early() -> None:
+    async def infinite_chunks() -> AsyncIterator[bytes]:
+        yield b"<root>"
+        while True:
+            await asyncio.sleep(0)
+            yield b"<item>x</item>"
+
+    async def run() -> list[str]:
+        items = []
+        parser = Parser(infinite_chunks())
+        async with aclosing(parser.aiter_from(handler)) as iterator:
+            async for item in iterator:
+                items.append(item)
+                if len(items) == 3:
+                    break
+        return items
+
+    assert asyncio.run(run()) == ["x", "x", "x"]
+
+
+def test_default_executor_not_used() -> None:
+    xml = b"<root><item>a</item><item>b</item></root>"
+
+    async def parse(parser: Parser) -> list[str]:
+        return [item async for item in parser.aiter_from(handler)]
+
+    async def run() -> list[list[str]]:
+        asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(2))
+        # more parsers than threads in the executor used by the streams
+        parsers = [Parser(ThreadReader(xml), read_size=4) for _ in range(4)]
+        return await asyncio.wait_for(
+            asyncio.gather(*(parse(parser) for parser in parsers)), 10
+        )
+
+    assert asyncio.run(run()) == [["a", "b"]] * 4
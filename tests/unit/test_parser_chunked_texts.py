@@ -0,0 +1,138 @@
+from collections.abc import Iterator
+
+import pytest
+
+from bigxml.handler_marker import xml_handle_element, xml_handle_text
+from bigxml.nodes import XMLElement, XMLText
+from bigxml.parser import Parser
+from bigxml.stats import ParserStats
+
+XML = (
+    b"<root>Hello<a>x <b>y</b> z<![CDATA[<c>]]></a>&amp; <a/>"
+    b"<a><b>deep<c>er</c></b></a><a>only text</a><a> </a>World!</root>"
+)
+
+
+@xml_handle_element("root")
+def handler(node: XMLElement) -> Iterator[tuple[str, str, list[str] | None]]:
+    for child in node.iter_from(lambda child: (child,)):
+        if isinstance(child, XMLText):
+            yield ("text", child.text, None)
+        else:
+            text = child.text
+            try:
+                # only possible when the element has no children
+                nested = [item.text for item in child.iter_from(lambda item: (item,))]
+            except RuntimeError:
+                nested = None
+            yield (child.name, text, nested)
+
+
+@pytest.mark.parametrize("read_size", [1, 7, 1024])
+def test_same_as_not_chunked(read_size: int) -> None:
+    items = list(
+        Parser(XML, read_size=read_size, chunked_texts=True).iter_from(handler)
+    )
+    assert items == list(Parser(XML, read_size=read_size).iter_from(handler))
+    assert items == [
+        ("text", "Hello", None),
+        ("a", "x y z<c>", None),
+        ("text", "& ", None),
+        ("a", "", []),
+        ("a", "deeper", None),
+        ("a", "only text", ["only text"]),
+        ("a", "", [" "]),
+        ("text", "World!", None),
+    ]
+
+
+def test_iter_chunks() -> None:
+    @xml_handle_text("root")
+    def text_handler(node: XMLText) -> Iterator[list[str]]:
+        yield list(node.iter_chunks())
+
+    xml = b"<root>" + b"a" * 10_000 + b"<foo>bar</foo>" + b"b" * 10_000 + b"</root>"
+    parser = Parser(xml, read_size=1_000, chunked_texts=True)
+    first, second = parser.iter_from(text_handler)
+    assert "".join(first) == "a" * 10_000
+    assert "".join(second) == "b" * 10_000
+    assert len(first) > 1
+    assert all(len(chunk) <= 1_000 for chunk in first + second)
+
+
+def test_iter_chunks_not_chunked() -> None:
+    @xml_handle_text("root")
+    def text_handler(node: XMLText) -> Iterator[list[str]]:
+        yield list(node.iter_chunks())
+
+    parser = Parser(b"<root>Hello<a />World</root>", read_size=1)
+    assert list(parser.iter_from(text_handler)) == [["Hello"], ["World"]]
+
+
+def test_iter_chunks_partially_read() -> None:
+    @xml_handle_text("root")
+    def text_handler(node: XMLText) -> Iterator[str]:
+        yield next(node.iter_chunks())
+
+    @xml_handle_element("root", "a")
+    def elem_handler(node: XMLElement) -> Iterator[str]:
+        yield node.name
+
+    parser = Parser(b"<root>Hello<a />World</root>", read_size=1, chunked_texts=True)
+    assert list(parser.iter_from(text_handler, elem_handler)) == ["H", "a", "W"]
+
+
+def test_iter_chunks_after_text() -> None:
+    @xml_handle_text("root")
+    def text_handler(node: XMLText) -> Iterator[tuple[str, list[str]]]:
+        yield (node.text, list(node.iter_chunks()))
+
+    parser = Parser(b"<root>Hello</root>", read_size=1, chunked_texts=True)
+    assert list(parser.iter_from(text_handler)) == [("Hello", ["Hello"])]
+
+
+def test_text_after_iter_chunks() -> None:
+    @xml_handle_text("root")
+    def text_handler(node: XMLText) -> Iterator[str]:
+        yield "".join(node.iter_chunks())
+        with pytest.raises(RuntimeError, match="Text already read by chunks"):
+            node.text  # noqa: B018
+        node.text = "World"
+        yield node.text
+
+    parser = Parser(b"<root>Hello</root>", read_size=1, chunked_texts=True)
+    assert list(parser.iter_from(text_handler)) == ["Hello", "World"]
+
+
+def test_out_of_order() -> None:
+    @xml_handle_text("root")
+    def text_handler(node: XMLText) -> Iterator[tuple[XMLText, Iterator[str]]]:
+        chunks = node.iter_chunks()
+        yield (node, chunks)
+
+    parser = Parser(b"<root>Hello<a />World</root>", read_size=1, chunked_texts=True)
+    items = parser.iter_from(text_handler)
+    first_node, first_chunks = next(items)
+    assert next(first_chunks) == "H"
+    second_node, _ = next(items)
+    with pytest.raises(RuntimeError, match="out of order"):
+        next(first_chunks)
+    assert not list(items)
+    with pytest.raises(RuntimeError, match="out of order"):
+        second_node.text  # noqa: B018
+    with pytest.raises(RuntimeError, match="Text already read by chunks"):
+        first_node.text  # noqa: B018
+
+
+def test_stats() -> None:
+    stats = ParserStats()
+    parser = Parser(XML, read_size=7, stats=stats, chunked_texts=True)
+    assert len(list(parser.iter_from(handler))) == 8
+    assert stats.bytes == len(XML)
+    assert stats.events > 2 * 10  # includes chunks of texts
+
+
+def test_iter_from_parallel() -> None:
+    parser = Parser(XML, chunked_texts=True)
+    with pytest.raises(ValueError, match="Chunked texts cannot be used"):
+        next(parser.iter_from_parallel(handler))
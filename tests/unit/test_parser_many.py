@@ -0,0 +1,159 @@
+from collections import Counter
+from collections.abc import Iterator
+
+import pytest
+
+from bigxml.handler_marker import xml_handle_element, xml_handle_text
+from bigxml.nodes import XMLElement, XMLText
+from bigxml.parser import Parser
+from bigxml.stats import ParserStats
+
+XML = (
+    b"<root xmlns:e='https://example.com/'>Hello"
+    b"<a id='1'><b>B1</b> and <b e:kind='x'>B2</b></a>"
+    b"<c><e:d>D1</e:d></c>"
+    b"<a id='2'><b>B3</b><c>nested</c></a>"
+    b"World!</root>"
+)
+
+
+@xml_handle_element("root", "a")
+def handle_a(node: XMLElement) -> Iterator[tuple[str, str]]:
+    yield (node.attributes["id"], node.text)
+
+
+@xml_handle_element("root", "a", "b")
+def handle_b(node: XMLElement) -> Iterator[tuple[str, str, tuple[str, ...]]]:
+    yield (node.text, str(node.attributes), tuple(p.name for p in node.parents))
+
+
+@xml_handle_element("root", "c", "{https://example.com/}d")
+def handle_d(node: XMLElement) -> Iterator[tuple[str, str, str]]:
+    yield (node.namespace, node.name, node.text)
+
+
+@xml_handle_text("root")
+def handle_text(node: XMLText) -> Iterator[str]:
+    yield node.text
+
+
+def handle_all(node: XMLElement | XMLText) -> Iterator[str]:
+    yield node.name
+
+
+@xml_handle_element("root")
+class Handler:
+    def __init__(self) -> None:
+        self.items: list[str] = []
+
+    @xml_handle_element("a", "b")
+    def handle_b(self, node: XMLElement) -> None:
+        self.items.append(f"b:{node.text}")
+
+    @xml_handle_element("c")
+    def handle_c(self, node: XMLElement) -> None:
+        self.items.append(f"c:{node.text}")
+
+    @xml_handle_text
+    def handle_text(self, node: XMLText) -> None:
+        self.items.append(f"text:{node.text}")
+
+
+def normalize(item: object) -> object:
+    if isinstance(item, Handler):
+        return item.items
+    return item
+
+
+@pytest.mark.parametrize("read_size", [1, 7, 1024])
+@pytest.mark.parametrize(
+    "handlers",
+    [
+        (handle_a, handle_d),
+        (handle_a, handle_b),
+        (handle_b, handle_a, handle_b),
+        (handle_text, handle_d, handle_a),
+        (handle_all, handle_b),
+        (Handler, handle_b, handle_text),
+        (handle_a,),
+        ("root", handle_b),
+    ],
+    ids=[
+        "disjoint",
+        "nested",
+        "same",
+        "texts",
+        "catchall",
+        "class",
+        "alone",
+        "path",
+    ],
+)
+def test_same_as_iter_from(handlers: tuple[object, ...], read_size: int) -> None:
+    items = [
+        (index, normalize(item))
+        for index, item in Parser(XML, read_size=read_size).iter_from_many(*handlers)
+    ]
+    for index, handler in enumerate(handlers):
+        assert [item for i, item in items if i == index] == [
+            normalize(item) for item in Parser(XML).iter_from(handler)
+        ]
+
+
+def test_document_order() -> None:
+    items = list(Parser(XML).iter_from_many(handle_text, handle_b, handle_a))
+    # items of handlers of a same element are given in the order of the handlers
+    assert items == [
+        (0, "Hello"),
+        (1, ("B1", "{}", ("root", "a"))),
+        (1, ("B2", "{'{https://example.com/}kind': 'x'}", ("root", "a"))),
+        (2, ("1", "B1 and B2")),
+        (1, ("B3", "{}", ("root", "a"))),
+        (2, ("2", "B3nested")),
+        (0, "World!"),
+    ]
+
+
+def test_nested_iteration_stopped_early() -> None:
+    @xml_handle_element("root", "rec")
+    def handle_rec(node: XMLElement) -> Iterator[str]:
+        yield next(node.iter_from("item")).text
+
+    @xml_handle_element("root", "other")
+    def handle_other(node: XMLElement) -> Iterator[str]:
+        yield node.name
+
+    xml = b"<root><rec><item>1</item><item>2</item></rec><other/></root>"
+    items = list(Parser(xml).iter_from_many(handle_rec, handle_other))
+    assert [item for _, item in items] == list(
+        Parser(xml).iter_from(handle_rec, handle_other)
+    )
+
+
+def test_no_handlers() -> None:
+    assert not list(Parser(XML).iter_from_many())
+
+
+def test_stats() -> None:
+    stats = ParserStats()
+    handlers = (handle_a, handle_b, handle_d)
+    assert len(list(Parser(XML, stats=stats).iter_from_many(*handlers))) == 6
+    expected: Counter[tuple[str, ...]] = Counter()
+    for handler in handlers:
+        handler_stats = ParserStats()
+        list(Parser(XML, stats=handler_stats).iter_from(handler))
+        expected += handler_stats.handled
+    assert stats.handled == expected
+
+
+def test_out_of_order() -> None:
+    parser = Parser(XML)
+    next(parser.iter_from(handle_a))
+    with pytest.raises(RuntimeError, match="out of order"):
+        next(parser.iter_from_many(handle_a, handle_b))
+
+
+def test_chunked_texts() -> None:
+    parser = Parser(XML, chunked_texts=True)
+    with pytest.raises(ValueError, match="Chunked texts cannot be used"):
+        next(parser.iter_from_many(handle_a, handle_b))
@@ -0,0 +1,126 @@
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+
+import pytest
+
+from bigxml.exceptions import BigXmlError
+from bigxml.handler_marker import xml_handle_element
+from bigxml.nodes import XMLElement
+from bigxml.parser import Parser
+
+XML = (
+    b"<root xmlns='urn:x' version='2'>"
+    + b"".join(b"<item id='%d'>x<b>%d</b></item>text" % (i, i) for i in range(50))
+    + b"</root>"
+)
+EXPECTED = [(str(i), f"x{i}", ("2",)) for i in range(50)]
+
+
+@xml_handle_element("{urn:x}root", "{urn:x}item")
+def handler(node: XMLElement) -> Iterator[tuple[str, str, tuple[str, ...]]]:
+    yield (
+        node.attributes["id"],
+        node.text,
+        tuple(parent.attributes["version"] for parent in node.parents),
+    )
+
+
+@pytest.mark.parametrize("batch_size", [1, 7, 100])
+def test_ordered(batch_size: int) -> None:
+    with ThreadPoolExecutor(4) as executor:
+        items = list(
+            Parser(XML).iter_from_parallel(
+                handler, batch_size=batch_size, executor=executor
+            )
+        )
+    assert items == EXPECTED
+
+
+def test_unordered() -> None:
+    released = Event()
+
+    @xml_handle_element("root", "item")
+    def slow_first(node: XMLElement) -> Iterator[str]:
+        if node.text == "0":
+            released.wait()
+        yield node.text
+
+    xml = b"<root><item>0</item><item>1</item></root>"
+    with ThreadPoolExecutor(2) as executor:
+        parser = Parser(xml)
+        items = parser.iter_from_parallel(
+            slow_first, ordered=False, batch_size=1, executor=executor
+        )
+        assert next(items) == "1"
+        released.set()  # the first item is only handled once the second one is given
+        assert list(items) == ["0"]
+
+
+def test_max_pending() -> None:
+    submitted = 0
+
+    class CountingExecutor(ThreadPoolExecutor):
+        def submit(self, *args: object, **kwargs: object) -> object:  # type: ignore[override]
+            nonlocal submitted
+            submitted += 1
+            return super().submit(*args, **kwargs)  # type: ignore[arg-type]
+
+    with CountingExecutor(1) as executor:
+        items = Parser(XML).iter_from_parallel(
+            handler, workers=1, batch_size=1, executor=executor
+        )
+        assert next(items) == EXPECTED[0]
+        assert submitted == 2
+
+
+def test_process_pool() -> None:
+    items = Parser(XML).iter_from_parallel(handler, workers=2, batch_size=10)
+    assert list(items) == EXPECTED
+
+
+def test_empty_root() -> None:
+    with ThreadPoolExecutor(1) as executor:
+        assert list(Parser(b"<root />").iter_from_parallel(executor=executor)) == []
+
+
+def test_parse_error() -> None:
+    with ThreadPoolExecutor(1) as executor:
+        items = Parser(b"<root><item /></root").iter_from_parallel(
+            handler, executor=executor
+        )
+        with pytest.raises(BigXmlError):
+            list(items)
+
+
+def test_handler_error() -> None:
+    @xml_handle_element("root", "item")
+    def failing_handler(node: XMLElement) -> Iterator[str]:
+        raise ValueError(node.text)
+
+    with ThreadPoolExecutor(1) as executor:
+        items = Parser(b"<root><item>oops</item></root>").iter_from_parallel(
+            failing_handler, executor=executor
+        )
+        with pytest.raises(ValueError, match="oops"):
+            list(items)
+
+
+def test_invalid_workers() -> None:
+    with pytest.raises(ValueError, match="Workers must be strictly positive"):
+        list(Parser(XML).iter_from_parallel(handler, workers=0))
+
+
+def test_invalid_batch_size() -> None:
+    with pytest.raises(ValueError, match="Batch size must be strictly positive"):
+        list(Parser(XML).iter_from_parallel(handler, batch_size=0))
+
+
+def test_out_of_order() -> None:
+    parser = Parser(XML)
+    assert next(parser.iter_from(handler)) == EXPECTED[0]
+    with (
+        ThreadPoolExecutor(4) as executor,
+        pytest.raises(RuntimeError, match="out of order"),
+    ):
+        next(parser.iter_from_parallel(handler, executor=executor))
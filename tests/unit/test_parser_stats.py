@@ -0,0 +1,91 @@
+from collections.abc import Iterator
+
+import pytest
+
+from bigxml.handler_marker import xml_handle_element, xml_handle_text
+from bigxml.nodes import XMLElement, XMLText
+from bigxml.parser import Parser
+from bigxml.stats import ParserStats
+
+XML = b"<root><a><b>1</b><b>2</b></a><a><b>3</b></a><c /></root>"
+
+
+@xml_handle_element("root", "a")
+class A:
+    def __init__(self) -> None:
+        self.values: list[str] = []
+
+    @xml_handle_text("b")
+    def handle_b(self, node: XMLText) -> None:
+        self.values.append(node.text)
+
+
+@xml_handle_element("root", "c")
+def handle_c(node: XMLElement) -> Iterator[str]:
+    yield node.name
+
+
+@pytest.mark.parametrize("read_size", [1, 7, 1024])
+def test_stats(read_size: int) -> None:
+    stats = ParserStats()
+    items = list(Parser(XML, read_size=read_size, stats=stats).iter_from(A, handle_c))
+    assert [getattr(item, "values", item) for item in items] == [["1", "2"], ["3"], "c"]
+    assert stats.bytes == len(XML)
+    assert stats.events == 2 * 7
+    assert stats.handled == {
+        ("root",): 1,
+        ("root", "a"): 2,
+        ("root", "a", "b"): 3,  # in the handler tree of class A
+        ("root", "c"): 1,
+    }
+    assert stats.read_seconds >= 0
+    assert stats.parse_seconds > 0
+    assert stats.handle_seconds > 0
+
+
+def test_stats_readable_while_parsing() -> None:
+    stats = ParserStats()
+    items = Parser(XML, read_size=1, stats=stats).iter_from(handle_c, A)
+    assert isinstance(next(items), A)
+    assert 0 < stats.bytes < len(XML)
+    assert 0 < stats.events < 2 * 7
+    assert stats.handled == {
+        ("root",): 1,
+        ("root", "a"): 1,
+        ("root", "a", "b"): 2,
+    }
+
+
+def test_paths_in_document() -> None:
+    @xml_handle_element("{urn:x}b")
+    def handle_b(node: XMLElement) -> Iterator[str]:
+        yield node.text
+
+    @xml_handle_element("root", "a")
+    def handle_a(node: XMLElement) -> Iterator[str]:
+        yield from node.iter_from(handle_b)
+
+    stats = ParserStats()
+    parser = Parser(b"<root xmlns:x='urn:x'><a><x:b>1</x:b></a></root>", stats=stats)
+    assert list(parser.iter_from(handle_a)) == ["1"]
+    assert stats.handled == {
+        ("root",): 1,
+        ("root", "a"): 1,
+        ("root", "a", "{urn:x}b"): 1,  # in a handler called by the one of a
+    }
+
+
+def test_callback() -> None:
+    calls: list[tuple[int, int]] = []
+
+    def callback(stats: ParserStats) -> None:
+        calls.append((stats.events, stats.handled[("root", "a")]))
+
+    stats = ParserStats(callback=callback, callback_every=4)
+    assert Parser(XML, stats=stats).return_from(handle_c) == "c"
+    assert calls == [(4, 0), (8, 0), (12, 0)]
+
+
+def test_invalid_callback_every() -> None:
+    with pytest.raises(ValueError, match="Callback every must be strictly positive"):
+        ParserStats(callback_every=0)
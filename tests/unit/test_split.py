@@ -0,0 +1,150 @@
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import pickle
+
+import pytest
+
+from bigxml.exceptions import BigXmlError
+from bigxml.handler_marker import xml_handle_element
+from bigxml.nodes import XMLElement
+from bigxml.parser import Parser
+from bigxml.split import FileRange, split_file
+from bigxml.typing import Streamable
+
+
+def records() -> Iterator[bytes]:
+    for i in range(100):
+        # looks like records in comments, CDATA sections and processing instructions
+        markup = (
+            b"<!-- <x:rec id='comment'> -->",
+            b"<![CDATA[ <x:rec id='cdata'> ]]>",
+            b"<?pi <x:rec id='pi' ?>",
+            b"",
+        )[i % 4]
+        yield b"<x:rec id='%d'>%s<v>%d</v></x:rec>\n" % (i, markup, i)
+
+
+XML = (
+    b"<?xml version='1.0' encoding='utf-8'?>\n"
+    b"<!-- <x:rec id='prolog'> -->\n"
+    b"<x:root xmlns:x='urn:x' version='2'>\n"
+    + b"".join(records())
+    + b"</x:root>\n<!-- end -->\n"
+)
+
+
+@xml_handle_element("{urn:x}root", "{urn:x}rec")
+def handler(node: XMLElement) -> Iterator[tuple[str, str]]:
+    yield (node.attributes["id"], node.parents[0].attributes["version"])
+
+
+def parse(streams: tuple[Streamable, ...]) -> list[tuple[str, str]]:
+    return list(Parser(*streams).iter_from(handler))
+
+
+@pytest.fixture
+def path(tmp_path: Path) -> Path:
+    path = tmp_path / "data.xml"
+    path.write_bytes(XML)
+    return path
+
+
+@pytest.mark.parametrize("parts", [1, 2, 3, 7, 1000])
+def test_split(path: Path, parts: int) -> None:
+    split = split_file(path, parts)
+    assert len(split) == min(parts, 100)
+    items = [item for streams in split for item in parse(streams)]
+    assert items == [(str(i), "2") for i in range(100)]
+
+
+def test_split_in_processes(path: Path) -> None:
+    with ProcessPoolExecutor(2) as executor:
+        items = [
+            item
+            for part_items in executor.map(parse, split_file(path, 4))
+            for item in part_items
+        ]
+    assert items == [(str(i), "2") for i in range(100)]
+
+
+@xml_handle_element("root")
+def children_handler(node: XMLElement) -> Iterator[tuple[str, str, str]]:
+    for child in node.iter_from(lambda child: (child,)):
+        assert isinstance(child, XMLElement)
+        yield (child.name, child.attributes.get("id", ""), child.text)
+
+
+@pytest.mark.parametrize("parts", [2, 3, 5, 6, 7, 8])
+def test_split_records_names(tmp_path: Path, parts: int) -> None:
+    # records of different names, with elements nested in them having the same names
+    path = tmp_path / "data.xml"
+    path.write_bytes(
+        b"<root><info><n>info</n><m /></info>"
+        + b"".join(
+            b"<n id='%d'><n>child</n></n><m id='%d' />" % (i, i) for i in range(20)
+        )
+        + b"</root>"
+    )
+    split = split_file(path, parts)
+    assert len(split) == parts
+    items = [
+        item
+        for streams in split
+        for item in Parser(*streams).iter_from(children_handler)
+    ]
+    assert items == list(Parser(path).iter_from(children_handler))
+    assert len(items) == 41
+
+
+@pytest.mark.parametrize(
+    "xml",
+    [
+        b"<root />",
+        b"<root>text</root>",
+        b"<root a='1' a='2'><a /></root>",
+        b"<\xc3\xa9l\xc3\xa9ments><a /><a /></\xc3\xa9l\xc3\xa9ments>",
+        b"<!DOCTYPE root [<!ENTITY a 'b'>]><root><a>&a;</a><a /></root>",
+        b"<root><a /><b>%s</b></root>" % (b"x" * 100),
+    ],
+    ids=["empty", "text", "invalid", "non-ascii", "entity", "big last record"],
+)
+def test_not_split(tmp_path: Path, xml: bytes) -> None:
+    path = tmp_path / "data.xml"
+    path.write_bytes(xml)
+    with pytest.warns(UserWarning, match="No split point found"):
+        assert split_file(path, 4) == [(path,)]
+
+
+def test_entity(tmp_path: Path) -> None:
+    path = tmp_path / "data.xml"
+    path.write_bytes(b"<!DOCTYPE root [<!ENTITY a 'b'>]><root><a>&a;</a></root>")
+    with pytest.warns(UserWarning, match="No split point found"):
+        (streams,) = split_file(path, 4)
+    with pytest.raises(BigXmlError, match="Entity definition is forbidden"):
+        list(Parser(*streams).iter_from("root"))
+
+
+def test_invalid_parts(path: Path) -> None:
+    with pytest.raises(ValueError, match="Parts must be strictly positive"):
+        split_file(path, 0)
+
+
+def test_file_range(path: Path) -> None:
+    file_range = pickle.loads(pickle.dumps(FileRange(path, 10, 20)))  # noqa: S301
+    assert file_range.readable()
+    buffer = bytearray(6)
+    assert file_range.readinto(buffer) == 6
+    assert buffer == XML[10:16]
+    assert file_range.readinto(buffer) == 4
+    assert buffer[:4] == XML[16:20]
+    assert file_range.readinto(buffer) == 0
+    file_range.close()
+    assert file_range.closed
+
+
+def test_file_range_empty(path: Path) -> None:
+    file_range = FileRange(path, 10, 10)
+    assert file_range.readinto(bytearray(6)) == 0
+    file_range.close()
+    assert file_range.closed
@@ -1,22 +1,42 @@
 from array import array
-from collections.abc import Iterator
+import bz2
+from collections.abc import Callable, Iterator
+import gzip
 import inspect
-from io import BytesIO, IOBase, StringIO
+from io import BytesIO, IOBase, RawIOBase, StringIO
+import lzma
 from mmap import mmap
+import os
+from pathlib import Path
 from string import ascii_lowercase
 import sys
+from threading import Thread
+from time import sleep
 from typing import cast
+from unittest.mock import patch
 
 import pytest
 
-from bigxml.stream import StreamChain
+from bigxml.stream import (
+    READ_SIZE_DEFAULT,
+    READ_SIZE_MAX,
+    READ_SIZE_MIN,
+    iter_chunks,
+)
 from bigxml.typing import Streamable
 
+if sys.version_info < (3, 12):  # pragma: no cover
+    from typing_extensions import Buffer
+else:  # pragma: no cover
+    from collections.abc import Buffer
+
+
+def read_all(*streams: Streamable, read_size: int = 42) -> list[bytes]:
+    return [bytes(chunk) for chunk in iter_chunks(*streams, read_size=read_size)]
+
 
 def test_no_stream() -> None:
-    stream = StreamChain()
-    assert stream.readable() is True
-    assert stream.read(42) == b""
+    assert not read_all()
 
 
 DATA = b"a\x00b\x7fc\x80d\xffe"
@@ -45,6 +65,7 @@ class CustomBuffer:
         DATA,
         bytearray(DATA),
         memoryview(DATA),
+        memoryview(bytes(x for byte in DATA for x in (byte, 0)))[::2],  # not contiguous
         array("B", DATA),
         to_mmap(DATA),
         BytesIO(DATA),
@@ -63,9 +84,37 @@ class CustomBuffer:
     ids=type,
 )
 def test_types(stream: Streamable) -> None:
-    stream = StreamChain(stream)
-    assert stream.read(42) == DATA
-    assert stream.read(42) == b""
+    assert read_all(stream) == [DATA]
+
+
+def test_path(tmp_path: Path) -> None:
+    path = tmp_path / "data.bin"
+    path.write_bytes(DATA)
+    (tmp_path / "empty.bin").touch()
+    for stream in (path, [tmp_path / "empty.bin", path, tmp_path / "empty.bin"]):
+        assert read_all(stream, read_size=4) == [DATA[:4], DATA[4:8], DATA[8:]]
+
+
+def test_path_closed(tmp_path: Path) -> None:
+    path = tmp_path / "data.bin"
+    path.write_bytes(DATA)
+    with patch("bigxml.stream.mmap", wraps=mmap) as mmap_mock:
+        assert read_all(path) == [DATA]
+    mapped = mmap_mock.return_value
+    assert mapped.closed
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="FIFOs not supported")
+def test_path_fifo(tmp_path: Path) -> None:
+    # the size of a FIFO is zero, but it has data
+    path = tmp_path / "data.fifo"
+    os.mkfifo(path)
+    writer = Thread(target=path.write_bytes, args=(DATA,))
+    writer.start()
+    try:
+        assert b"".join(read_all(path, read_size=4)) == DATA
+    finally:
+        writer.join()
 
 
 def abcdef_str_generator() -> Iterator[str]:
@@ -119,9 +168,8 @@ class IntIO(IOBase):
     ],
 )
 def test_types_invalid(stream: object, err_message: str) -> None:
-    stream = StreamChain(cast("Streamable", stream))
     with pytest.raises(TypeError) as excinfo:
-        stream.read(42)
+        read_all(cast("Streamable", stream))
 
     assert err_message in str(excinfo.value)
 
@@ -132,7 +180,7 @@ def op_qr_generator() -> Iterator[bytes]:
 
 
 def test_chain_types() -> None:
-    stream = StreamChain(
+    assert read_all(
         b"ab",
         bytearray(b"cd"),
         memoryview(b"ef"),
@@ -141,36 +189,51 @@ def test_chain_types() -> None:
         (b"kl",),
         iter([b"mn"]),
         op_qr_generator(),
-    )
-    assert stream.read(42) == b"ab"
-    assert stream.read(42) == b"cd"
-    assert stream.read(42) == b"ef"
-    assert stream.read(42) == b"gh"
-    assert stream.read(42) == b"ij"
-    assert stream.read(42) == b"kl"
-    assert stream.read(42) == b"mn"
-    assert stream.read(42) == b"op"
-    assert stream.read(42) == b"qr"
-    assert stream.read(42) == b""
+    ) == [b"ab", b"cd", b"ef", b"gh", b"ij", b"kl", b"mn", b"op", b"qr"]
 
 
 def test_skip_empty_values() -> None:
-    stream = StreamChain(b"", b"", b"abc", b"", b"", b"def", b"", b"ghi", b"")
-    assert stream.read(42) == b"abc"
-    assert stream.read(42) == b"def"
-    assert stream.read(42) == b"ghi"
-    assert stream.read(42) == b""
+    streams = (b"", b"", b"abc", b"", b"", b"def", b"", b"ghi", b"")
+    assert read_all(*streams) == [b"abc", b"def", b"ghi"]
 
 
 def test_stream_part_above_read_size() -> None:
-    stream = StreamChain(ascii_lowercase.encode())
-    assert stream.read(4) == b"abcd"
-    assert stream.read(8) == b"efghijkl"
-    assert stream.read(2) == b"mn"
-    assert stream.read(8) == b"opqrstuv"
-    assert stream.read(1) == b"w"
-    assert stream.read(8) == b"xyz"
-    assert stream.read(8) == b""
+    assert read_all(ascii_lowercase.encode(), read_size=8) == [
+        b"abcdefgh",
+        b"ijklmnop",
+        b"qrstuvwx",
+        b"yz",
+    ]
+
+
+class ReadIntoIO(RawIOBase):
+    def __init__(self, data: bytes) -> None:
+        super().__init__()
+        self.data = data
+        self.sizes: list[int] = []
+
+    def readinto(self, buffer: Buffer) -> int:
+        view = memoryview(buffer)
+        self.sizes.append(len(view))
+        size = min(len(view), len(self.data))
+        view[:size], self.data = self.data[:size], self.data[size:]
+        return size
+
+    @staticmethod
+    def readable() -> bool:
+        return True
+
+
+def test_readinto() -> None:
+    source = ReadIntoIO(b"defgh")
+    assert read_all(b"abc", source, [b"", b"ijklmn"], read_size=4) == [
+        b"abc",
+        b"defg",
+        b"h",
+        b"ijkl",
+        b"mn",
+    ]
+    assert source.sizes == [4, 4, 4]  # source filled the buffers directly
 
 
 class InfiniteIO(IOBase):
@@ -212,15 +275,106 @@ class InfiniteIO(IOBase):
     ids=repr,
 )
 def test_pass_read_size(streams: tuple[Streamable, ...]) -> None:
-    stream = StreamChain(*streams)
-    assert stream.read(3) == b"***"
-    assert stream.read(4) == b"4444"
-    assert stream.read(8) == b"88888888"
-    assert stream.read(2) == b"22"
-
-
-@pytest.mark.parametrize("size", [None, -1, 0])
-def test_invalid_read_sizes(size: int | None) -> None:
-    stream = StreamChain(b"Hello, world!")
-    with pytest.raises(NotImplementedError):
-        stream.read(size)
+    chunks = iter_chunks(*streams, read_size=8)
+    assert next(chunks) == b"***"
+    assert next(chunks) == b"88888888"
+    assert next(chunks) == b"88888888"
+
+
+def test_iter_chunks() -> None:
+    chunks = iter_chunks(ascii_lowercase.encode(), [b"", BytesIO(b"0123")], read_size=4)
+    assert [bytes(chunk) for chunk in chunks] == [
+        b"abcd",
+        b"efgh",
+        b"ijkl",
+        b"mnop",
+        b"qrst",
+        b"uvwx",
+        b"yz",
+        b"0123",
+    ]
+
+
+def test_iter_chunks_reuse_buffer() -> None:
+    chunks = iter_chunks(b"abcdef", read_size=3)
+    chunk = next(chunks)
+    assert chunk == b"abc"
+    assert next(chunks) == b"def"
+    assert chunk == b"def"  # only valid until next chunk
+
+
+@pytest.mark.parametrize("prefetch", [1, 3])
+def test_iter_chunks_prefetch(prefetch: int) -> None:
+    data = ascii_lowercase.encode() * 10
+    chunks = iter_chunks(data, read_size=4, prefetch=prefetch)
+    first = next(chunks)
+    sleep(0.01)  # let the worker thread read ahead
+    assert first == b"abcd"  # buffer not overwritten by chunks read ahead
+    assert b"".join([bytes(first), *(bytes(chunk) for chunk in chunks)]) == data
+
+
+def test_iter_chunks_prefetch_error() -> None:
+    chunks = iter_chunks(b"abcd", "invalid", read_size=4, prefetch=2)
+    assert next(chunks) == b"abcd"
+    with pytest.raises(TypeError, match="Invalid stream type: str"):
+        next(chunks)
+
+
+def test_iter_chunks_adaptive() -> None:
+    data = bytes(READ_SIZE_MAX * 4)
+    chunks = iter_chunks(
+        bytes(READ_SIZE_DEFAULT // 2),
+        data,
+        [b"<small>"] * 10,
+        data,
+        read_size=None,
+    )
+
+    # unchanged on chunks that are not much smaller
+    assert len(next(chunks)) == READ_SIZE_DEFAULT // 2
+
+    # grows while chunks are full
+    sizes = [len(next(chunks)) for _ in range(7)]
+    assert sizes == [READ_SIZE_DEFAULT * 2**i for i in range(5)] + [READ_SIZE_MAX] * 2
+
+    # shrinks on small chunks
+    while len(next(chunks)) != 7:
+        pass
+    sizes = [len(next(chunks)) for _ in range(9)]
+    assert sizes == [7] * 9
+    assert len(next(chunks)) == READ_SIZE_MIN
+    assert len(next(chunks)) == READ_SIZE_MIN * 2
+
+
+COMPRESSIONS = {
+    "gzip": gzip.compress,
+    "bz2": bz2.compress,
+    "xz": lzma.compress,
+}
+
+
+@pytest.mark.parametrize("compress", COMPRESSIONS.values(), ids=COMPRESSIONS.keys())
+def test_compressed(compress: Callable[[bytes], bytes]) -> None:
+    data = ascii_lowercase.encode() * 1000
+    compressed = compress(data)
+    for streams in (
+        (compressed,),
+        ([compressed[:1], compressed[1:2], compressed[2:]],),  # magic bytes split
+        (compress(data[:42]), compress(data[42:])),  # several members
+        (compressed + b"\0" * 8,),  # zero padding
+        (compress(data[:42]) + b"\0", b"\0" * 3, compress(data[42:]) + b"\0"),
+    ):
+        for read_size in (1, 7, 1024):
+            assert b"".join(read_all(*streams, read_size=read_size)) == data
+
+
+@pytest.mark.parametrize("compress", COMPRESSIONS.values(), ids=COMPRESSIONS.keys())
+def test_compressed_truncated(compress: Callable[[bytes], bytes]) -> None:
+    compressed = compress(ascii_lowercase.encode())
+    with pytest.raises(EOFError, match="Compressed file ended"):
+        read_all(compressed[:-4])
+
+
+@pytest.mark.parametrize("data", [b"B", b"BZ", b"Bad", b"Bad data"])
+def test_not_compressed(data: bytes) -> None:
+    assert read_all(data) == [data]
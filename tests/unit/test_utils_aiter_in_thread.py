@@ -0,0 +1,85 @@
+import asyncio
+from collections.abc import Iterable, Iterator
+from contextlib import aclosing
+from threading import get_ident
+
+import pytest
+
+from bigxml.utils import aiter_in_thread
+
+
+def collect(iterable: Iterable[object]) -> list[object]:
+    async def run() -> list[object]:
+        return [item async for item in aiter_in_thread(iterable, 4)]
+
+    return asyncio.run(run())
+
+
+def test_iterable() -> None:
+    assert collect(range(10)) == list(range(10))
+    assert collect([]) == []
+
+
+def test_run_in_thread() -> None:
+    def generate() -> Iterator[int]:
+        yield get_ident()
+
+    assert collect(generate()) != [get_ident()]
+
+
+def test_max_pending() -> None:
+    produced = 0
+
+    def generate() -> Iterator[int]:
+        nonlocal produced
+        for i in range(20):
+            produced += 1
+            yield i
+
+    async def run() -> list[int]:
+        consumed: list[int] = []
+        async for item in aiter_in_thread(generate(), 3):
+            await asyncio.sleep(0.01)
+            assert produced <= len(consumed) + 5
+            consumed.append(item)
+        return consumed
+
+    assert asyncio.run(run()) == list(range(20))
+
+
+def test_exception() -> None:
+    def generate() -> Iterator[int]:
+        yield 1
+        raise ValueError("oops")
+
+    async def run() -> list[int]:
+        return [item async for item in aiter_in_thread(generate(), 4)]
+
+    with pytest.raises(ValueError, match="oops"):
+        asyncio.run(run())
+
+
+def test_stop_early() -> None:
+    closed = False
+
+    def generate() -> Iterator[int]:
+        nonlocal closed
+        try:
+            i = 0
+            while True:
+                yield i
+                i += 1
+        finally:
+            closed = True
+
+    async def run() -> list[int]:
+        items = []
+        async with aclosing(aiter_in_thread(generate(), 2)) as iterator:
+            async for item in iterator:
+                items.append(item)
+                if item == 5:
+                    break
+        return items
+
+    assert asyncio.run(run()) == [0, 1, 2, 3, 4, 5]
+    assert closed
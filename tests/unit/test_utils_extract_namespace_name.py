@@ -1,3 +1,5 @@
+import sys
+
 from bigxml.utils import extract_namespace_name
 
 
@@ -14,3 +16,23 @@ def test_namespace() -> None:
 
 def test_empty_namespace() -> None:
     assert extract_namespace_name("{}foo") == ("", "foo")
+
+
+def test_invalid_namespace() -> None:
+    assert extract_namespace_name("{foo") == ("", "{foo")
+
+
+def test_several_namespaces() -> None:
+    assert extract_namespace_name("{foo}{bar}baz") == ("foo", "{bar}baz")
+
+
+def test_cache() -> None:
+    namespace, local_name = "{https://example.com/xml/}", "cached"
+    info = extract_namespace_name.cache_info()
+    first = extract_namespace_name(f"{namespace}{local_name}")
+    second = extract_namespace_name(f"{namespace}{local_name}")
+    assert first is second
+    assert first[1] is sys.intern("cached")
+    new_info = extract_namespace_name.cache_info()
+    assert new_info.misses == info.misses + 1
+    assert new_info.hits == info.hits + 1
@@ -1,4 +1,7 @@
 from collections.abc import Callable
+import gc
+from unittest.mock import patch
+from weakref import ref
 
 import pytest
 
@@ -61,3 +64,70 @@ def test_mandatory_params(  # type: ignore[misc]
     fct: Callable[..., object], expected: tuple[str, ...]
 ) -> None:
     assert get_mandatory_params(fct) == expected
+
+
+class Klass:
+    def __init__(self, arg0: int, arg1: int = 1) -> None:
+        pass  # for tests
+
+    def method(self, arg0: int, arg1: int = 1) -> None:
+        pass  # for tests
+
+    @classmethod
+    def class_method(cls, arg0: int, arg1: int = 1) -> None:
+        pass  # for tests
+
+    @staticmethod
+    def static_method(arg0: int, arg1: int = 1) -> None:
+        pass  # for tests
+
+
+class NoWeakRef:
+    __slots__ = ()
+
+    def __call__(self, arg0: int, arg1: int = 1) -> None:
+        pass  # for tests
+
+
+@pytest.mark.parametrize(
+    ["fct", "expected"],
+    [
+        (Klass, ("arg0",)),
+        (Klass.method, ("self", "arg0")),
+        (Klass(0).method, ("arg0",)),
+        (Klass.class_method, ("arg0",)),
+        (Klass.static_method, ("arg0",)),
+        (Klass(0).static_method, ("arg0",)),
+        (len, ("obj",)),
+    ],
+    ids=str,
+)
+# Typing note: see https://github.com/python/mypy/issues/13436
+def test_mandatory_params_cached(  # type: ignore[misc]
+    fct: Callable[..., object], expected: tuple[str, ...]
+) -> None:
+    assert get_mandatory_params(fct) == expected
+    with patch("bigxml.utils.signature", side_effect=AssertionError):
+        assert get_mandatory_params(fct) == expected
+
+
+def test_mandatory_params_not_weakly_referenceable() -> None:
+    fct = NoWeakRef()
+    assert get_mandatory_params(fct) == ("arg0",)
+    with (
+        patch("bigxml.utils.signature", side_effect=AssertionError),
+        pytest.raises(AssertionError),
+    ):
+        get_mandatory_params(fct)
+
+
+def test_mandatory_params_cache_weak() -> None:
+    class Handler:
+        def __init__(self, arg0: int) -> None:
+            pass  # for tests
+
+    assert get_mandatory_params(Handler) == ("arg0",)
+    handler_ref = ref(Handler)
+    del Handler
+    gc.collect()
+    assert handler_ref() is None
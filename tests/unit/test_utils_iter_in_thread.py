@@ -0,0 +1,84 @@
+from collections.abc import Iterator
+from contextvars import ContextVar
+from threading import get_ident
+from time import sleep
+
+import pytest
+
+from bigxml.utils import iter_in_thread
+
+
+def test_iterable() -> None:
+    assert list(iter_in_thread(range(10), 4)) == list(range(10))
+    assert list(iter_in_thread([], 4)) == []
+
+
+def test_run_in_thread() -> None:
+    def generate() -> Iterator[int]:
+        yield get_ident()
+
+    assert list(iter_in_thread(generate(), 4)) != [get_ident()]
+
+
+def test_context() -> None:
+    var: ContextVar[str] = ContextVar("var", default="default")
+
+    def generate() -> Iterator[str]:
+        yield var.get()
+
+    token = var.set("value")
+    try:
+        assert list(iter_in_thread(generate(), 4)) == ["value"]
+    finally:
+        var.reset(token)
+
+
+def test_max_pending() -> None:
+    produced = 0
+
+    def generate() -> Iterator[int]:
+        nonlocal produced
+        for i in range(20):
+            produced += 1
+            yield i
+
+    consumed: list[int] = []
+    for item in iter_in_thread(generate(), 3):
+        sleep(0.01)
+        assert produced <= len(consumed) + 5
+        consumed.append(item)
+    assert consumed == list(range(20))
+
+
+def test_exception() -> None:
+    def generate() -> Iterator[int]:
+        yield 1
+        raise ValueError("oops")
+
+    with pytest.raises(ValueError, match="oops"):
+        list(iter_in_thread(generate(), 4))
+
+
+def test_stop_early() -> None:
+    closed = False
+
+    def generate() -> Iterator[int]:
+        nonlocal closed
+        try:
+            i = 0
+            while True:
+                yield i
+                i += 1
+        finally:
+            closed = True
+
+    items = []
+    iterator = iter_in_thread(generate(), 2)
+    for item in iterator:
+        items.append(item)
+        if item == 5:
+            break
+    iterator.close()
+
+    assert items == [0, 1, 2, 3, 4, 5]
+    assert closed